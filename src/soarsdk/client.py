@@ -1,18 +1,42 @@
 import glob
 import json
 import pathlib
+import random
 import tarfile
 import textwrap
+import threading
+import time
+from collections import OrderedDict, deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from hashlib import sha256
-from typing import Union
+from operator import attrgetter
+from typing import Iterable, Optional, Union
 import colorama
 import requests
 from requests import Response
-from requests.models import HTTPError
+from requests.adapters import HTTPAdapter
 from requests.structures import CaseInsensitiveDict
 
 from urllib3.exceptions import InsecureRequestWarning
 from urllib3 import disable_warnings
+from urllib3.fields import RequestField
+from urllib3.filepost import choose_boundary
+from urllib3.util import Retry, make_headers
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import httpx
+except ImportError:
+    httpx = None
+
+try:
+    import ijson
+except ImportError:
+    ijson = None
 
 from .exceptions import (
     ArtifactNotInitialized,
@@ -37,35 +61,209 @@ from .objects import (
 )
 
 
+# colorama.init() wraps stdout process-wide, so it only needs to run for the first client
+_COLORAMA_INITIALIZED: bool = False
+
+
+def _init_colorama() -> None:
+    """Enables the ANSI colors used by exception messages, once per process"""
+    global _COLORAMA_INITIALIZED
+    if not _COLORAMA_INITIALIZED:
+        colorama.init()
+        _COLORAMA_INITIALIZED = True
+
+
+# Pooled connections kept per host. Sized for nested concurrent fetches so worker threads do not open throwaway connections
+_CONNECTION_POOL_SIZE: int = 64
+
+# Parameters sent as-is rather than quoted as JSON strings
+_UNQUOTED_PARAMS: frozenset[str] = frozenset(["start_time", "sort", "order"])
+
+# Status codes requests.Response.raise_for_status() treats as failures
+_ERROR_STATUS_CODES: frozenset[int] = frozenset(range(400, 600))
+
+# Prefixes of absolute URLs, which are requested as-is instead of joined onto the REST endpoint
+_URL_SCHEMES: tuple[str, ...] = ("http://", "https://")
+
+# Session attribute for each supported HTTP method. Names rather than bound methods, since the session can be replaced
+_SESSION_METHODS: dict[str, str] = {
+    method: method.lower() for method in ("GET", "POST", "DELETE", "PUT", "PATCH")
+}
+
+_LOG_TEMPLATE: str = textwrap.dedent("""
+    ─────────────── Request ───────────────
+    {method} {url}
+    {reqhdrs}
+    {req_body_json}
+    ─────────────── Response ───────────────
+    {status_code} {reason} {res_url}
+    {resp_body_json}
+    ────────────────────────────────────────
+""")
+
+# Request and response bodies longer than this are truncated in requests_log entries
+_LOG_BODY_LIMIT: int = 2048
+
+# Bytes of a file read and sent at a time by upload_file()
+_UPLOAD_CHUNK_SIZE: int = 1024 * 1024
+
+
+def _truncate_body(body: Union[str, bytes, None]) -> str:
+    """Returns a request or response body as text, cut to _LOG_BODY_LIMIT bytes or characters.
+    Bytes are cut before decoding so large bodies are not decoded in full
+    """
+    if body is None:
+        return ""
+    if not isinstance(body, (str, bytes)):
+        # Streamed bodies are consumed while they are sent
+        return "<streamed body>"
+    if len(body) <= _LOG_BODY_LIMIT:
+        return body.decode("utf-8", "replace") if isinstance(body, bytes) else body
+    body = body[:_LOG_BODY_LIMIT]
+    if isinstance(body, bytes):
+        body = body.decode("utf-8", "replace")
+    return body + "... <truncated>"
+
+
+def _dump_json_string(value: str) -> str:
+    """Encodes a string parameter as a JSON string literal, using orjson when it is installed"""
+    if orjson is not None:
+        return orjson.dumps(value).decode()
+    return json.dumps(value)
+
+
+def _load_json(response: Response) -> Union[dict, list]:
+    """Decodes a JSON response body, using orjson when it is installed. Empty bodies decode to an empty dict"""
+    if not response.content:
+        return {}
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
+def _load_error_body(response: Response) -> dict:
+    """Decodes the body of a failed response once for ServerException. Bodies that are not JSON objects decode to an
+    empty dict"""
+    try:
+        body = _load_json(response)
+    except ValueError:
+        return {}
+    return body if isinstance(body, dict) else {}
+
+
+def _iter_response_data(response: Response):
+    """Yields the items of a streamed response's data list as they are parsed, closing the response once exhausted"""
+    try:
+        # Let urllib3 undo any gzip/deflate content encoding before ijson reads the body
+        response.raw.decode_content = True
+        yield from ijson.items(response.raw, "data.item", use_float=True)
+    finally:
+        response.close()
+
+
+class _MultipartFileUpload:
+    """multipart/form-data request body that reads a file in _UPLOAD_CHUNK_SIZE chunks as it is sent, updating a
+    SHA-256 digest with each chunk. Its length is known up front, so requests streams it with a Content-Length header
+    instead of building the whole body in memory like it does for files=
+    """
+
+    def __init__(self, fields: dict, file_name: str, file_handle, file_size: int):
+        boundary: str = choose_boundary()
+        self.content_type: str = f"multipart/form-data; boundary={boundary}"
+        self._file_handle = file_handle
+        self._hash = sha256()
+
+        # Laid out like urllib3.encode_multipart_formdata(), which requests uses for files=
+        parts: list[bytes] = []
+        for name, value in fields.items():
+            field = RequestField(name=name, data=value)
+            field.make_multipart()
+            parts.append(
+                f"--{boundary}\r\n{field.render_headers()}{value}\r\n".encode()
+            )
+        file_field = RequestField(name="file", data=b"", filename=file_name)
+        file_field.make_multipart()
+        parts.append(f"--{boundary}\r\n{file_field.render_headers()}".encode())
+        self._preamble: bytes = b"".join(parts)
+        self._epilogue: bytes = f"\r\n--{boundary}--\r\n".encode()
+        self._length: int = len(self._preamble) + file_size + len(self._epilogue)
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self):
+        yield self._preamble
+        while chunk := self._file_handle.read(_UPLOAD_CHUNK_SIZE):
+            self._hash.update(chunk)
+            yield chunk
+        yield self._epilogue
+
+    def hexdigest(self) -> str:
+        """Returns the digest of the file contents sent so far, which is the whole file once the request completes"""
+        return self._hash.hexdigest()
+
+
 class PhantomClient:
     def __init__(self, url: str, **kwargs):
         """
         Class responsible for handling connections and requests to the Splunk SOAR instance.
-        
+
         Keyword Args:
             url (str): Target Server Hostname
             splunkToken (Optional[str]): Token for Authentication
             username (Optional[str]): Username for Authentication
             password (Optional[str]): Password for Authentication
             verify (bool): Enable SSL Verification for requests to and from the Splunk SOAR instance
+            debug_log (bool): Record requests and responses in requests_log. Defaults to False
+            log_maxlen (int): Maximum number of requests retained in requests_log. Defaults to 1000
+            http2 (bool): Send requests over HTTP/2 using httpx. Streamed downloads and file uploads still use the session
 
         Attributes:
             base_url (str): Base domain address of the Splunk SOAR instance
             rest_url (str): REST endpoint of the Splunk SOAR instance inferred from base_url
             action_builder (list): Cache for available actions and app configurations
-            request_log (list): Cache of requests between the Client and the SOAR server
+            _playbook_id_cache (dict): Cache of playbook names resolved to playbook IDs
+            _playbook_name_cache (dict): Cache of playbook IDs resolved to playbook names
+            _hash_cache (OrderedDict): Bounded cache of object hashes resolved by find_by_hash
+            request_log (deque): Cache of the most recent responses between the Client and the SOAR server when debug_log is enabled
             _TLS_VERIFY (bool): SSL Verification for requests. Defaults to False
+            _executor (ThreadPoolExecutor): Worker pool used to issue independent requests concurrently, shut down by close()
             session (requests.Session): Session object used for the requests library
 
         """
-        colorama.init()
+        _init_colorama()
         self.base_url: str = url + "/" if not url.endswith("/") else url
         self.rest_url = self.base_url + "rest/"
+        # Cache of endpoint paths resolved to full URLs
+        self._url_cache: dict[str, str] = {}
         # Cache for actions builder query
         self.action_builder: dict = {}
+        # Objects built from the action builder, created on first use
+        self._apps_cache: list[App] = None
+        self._apps_by_lower_name: dict[str, App] = {}
+        self._actions_cache: list[Action] = None
+        self._assets_cache: list[Asset] = None
+        # Cache of playbook names to their IDs
+        self._playbook_id_cache: dict[str, int] = {}
+        # Cache of playbook IDs to their names
+        self._playbook_name_cache: dict[int, str] = {}
+        # Least recently used cache of (object_type, hash) to object IDs
+        self._hash_cache: OrderedDict[tuple[str, str], int] = OrderedDict()
         # Cache of requests & responses
-        self.requests_log: list = []
+        self.requests_log: deque = deque(maxlen=kwargs.get("log_maxlen", 1000))
+        self._debug_log: bool = kwargs.get("debug_log", False)
+        # Worker threads for independent requests issued together
+        self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=8)
         self._TLS_VERIFY: bool = kwargs.get("verify", False)
+        # Optional HTTP/2 transport, created on first use so it picks up the authenticated session
+        self._http2: bool = kwargs.get("http2", False)
+        self._http2_client = None
+        self._http2_lock: threading.Lock = threading.Lock()
+
+        if self._http2 and httpx is None:
+            raise ImportError(
+                "PhantomClient(http2=True) requires httpx with HTTP/2 support. Install it with pip install soarsdk[http2]"
+            )
 
         if not self._TLS_VERIFY: 
             disable_warnings(InsecureRequestWarning)
@@ -85,16 +283,59 @@ class PhantomClient:
                 "No arguments for connection provided. Provide either a username & password, an API token, or an authenticated session"
             )
 
-        self.session = (
-            kwargs.get("session") if kwargs.get("session") else requests.Session()
-        )
+        # A session provided by the caller keeps its own adapters, headers and verify setting, so TLS verification is
+        # passed with each request instead. A client-created session carries it, see _configure_session()
+        if kwargs.get("session"):
+            self.session = kwargs.get("session")
+            self._request_verify: Optional[bool] = self._TLS_VERIFY
+        else:
+            self.session = requests.Session()
+            self._request_verify = None
+            self._configure_session()
 
         if not kwargs.get("session"):
             self.connect(**kwargs)
         else:
             self.test_authorization()
-            
-     
+
+    def _configure_session(self) -> None:
+        """Mounts a pooled HTTPAdapter on a client-created session so back-to-back requests reuse the same TCP/TLS
+        connections, and sets its TLS verification and its keep-alive and compression headers. Only idempotent methods
+        are retried to avoid duplicating created objects.
+        """
+        self.session.verify = self._TLS_VERIFY
+        adapter = HTTPAdapter(
+            pool_connections=_CONNECTION_POOL_SIZE,
+            pool_maxsize=_CONNECTION_POOL_SIZE,
+            max_retries=Retry(
+                total=3,
+                backoff_factor=0.3,
+                status_forcelist=(502, 503, 504),
+                allowed_methods=frozenset(["GET", "DELETE"]),
+                raise_on_status=False,
+            ),
+        )
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+        self.session.headers["Connection"] = "keep-alive"
+        # Negotiate every compression scheme urllib3 can decode (brotli/zstd only when installed)
+        self.session.headers["Accept-Encoding"] = make_headers(accept_encoding=True)[
+            "accept-encoding"
+        ]
+
+    def close(self) -> None:
+        """Shuts down the client's worker threads and closes its session and HTTP/2 transport"""
+        self._executor.shutdown(wait=True)
+        if self._http2_client is not None:
+            self._http2_client.close()
+            self._http2_client = None
+        self.session.close()
+
+    def __enter__(self) -> "PhantomClient":
+        return self
+
+    def __exit__(self, *exc_info) -> None:
+        self.close()
 
     def connect(
         self,
@@ -122,8 +363,8 @@ class PhantomClient:
         Returns:
             success: Determine if we can get data out of Phantom.
         """
-        url: str = self.base_url + "rest/version"
-        response: requests.Response = self.session.get(url, verify=False)
+        url: str = self._url("version")
+        response: requests.Response = self.session.get(url, verify=self._request_verify)
         if not response.status_code == 200:
             raise AuthenticationError(
                 f"Failed to authenticate to {self.base_url} with provided credentials"
@@ -138,7 +379,7 @@ class PhantomClient:
         """
         url: str = self.base_url + "browse"
         response: requests.Response = self.session.get(
-            self.base_url, auth=(username, password), verify=False
+            self.base_url, auth=(username, password), verify=self._request_verify
         )
         response.raise_for_status()
         self._set_session_headers()
@@ -200,7 +441,7 @@ class PhantomClient:
 
         # post to the container endpoint to create a container
         container_post: dict = self._handle_request(
-            method="POST", url="container?", data=valid_container
+            method="POST", url="container?", json=valid_container
         )
 
         container.id = int(container_post["id"])
@@ -226,16 +467,51 @@ class PhantomClient:
                 f"create_artifacts() requires an existing Container"
             )
 
+        new_artifacts: list[Artifact] = list(args)
+        provided_artifacts: set[int] = {id(artifact) for artifact in args}
         for artifact in container.artifacts:
-            if not artifact.id and not artifact.container:
-                args.extend(artifact)
-
-        for artifact in args:
+            if (
+                not artifact.id
+                and not artifact.container
+                and id(artifact) not in provided_artifacts
+            ):
+                new_artifacts.append(artifact)
+
+        for artifact in new_artifacts:
             artifact.container_id = container.id
-            artifact_id: int = self._handle_request(
-                method="POST", url="artifact?", data=artifact.toJson()
-            ).get("id")
-            artifact.id = artifact_id
+
+        if new_artifacts:
+            # Create every artifact in one request, falling back to one request per artifact if the server rejects the list
+            try:
+                created_artifacts: Union[list, dict] = self._handle_request(
+                    method="POST",
+                    url="artifact",
+                    json=[artifact.toDict() for artifact in new_artifacts],
+                )
+            except ServerException as e:
+                # Only a client error means the list itself was refused. After any other failure some artifacts
+                # may already exist, so posting them again would duplicate them
+                if not 400 <= e.error_code < 500:
+                    raise
+                created_artifacts = [
+                    self._handle_request(method="POST", url="artifact?", json=artifact)
+                    for artifact in new_artifacts
+                ]
+
+            # The bulk endpoint answers {"ids": [...], "success": true}, while per-artifact requests return one
+            # {"id": ...} record each
+            if isinstance(created_artifacts, dict):
+                if "ids" in created_artifacts:
+                    created_ids: list[int] = created_artifacts["ids"]
+                else:
+                    created_ids = [created_artifacts.get("id")]
+            else:
+                created_ids = [
+                    created_artifact.get("id") for created_artifact in created_artifacts
+                ]
+
+            for artifact, created_id in zip(new_artifacts, created_ids):
+                artifact.id = created_id
         # update artifacts that have been created
         self.update_artifacts(container)
 
@@ -287,17 +563,23 @@ class PhantomClient:
 
             playbook.run_id = response.get("playbook_run_id")
 
-            playbook_running = True
-
+            # Back off between polls while the playbook runs, resetting once an approval is answered
+            delay: float = 0.5
+            playbook_running, pending_approvals = self._poll_playbook_state(container)
             while playbook_running:
-                playbook_running: bool = self.is_playbook_running(container)
-                pending_approvals: list[dict] = self.check_approvals(container)
                 if pending_approvals:
                     self.answer_approvals(
                         container=container,
                         playbook=playbook,
                         approvals=pending_approvals,
                     )
+                    delay = 0.5
+                else:
+                    time.sleep(delay + random.uniform(0, delay / 4))
+                    delay = min(delay * 2, 8.0)
+                playbook_running, pending_approvals = self._poll_playbook_state(
+                    container
+                )
         self.update_container_values(container)
 
         for playbook in container.playbooks:
@@ -305,12 +587,18 @@ class PhantomClient:
                 raise PlaybookException(playbook) from None
 
     def delete_container(self, *args: list[Container]) -> None:
-        """Delete one or many containers from Splunk SOAR"""
-        self._handle_request(
-            method="DELETE",
-            url="container",
-            params={"ids": [container.id for container in args]},
+        """Delete one or many containers from Splunk SOAR. Duplicate IDs are removed and large deletes
+        are split into batches to stay within URL length limits"""
+        batch_size: int = 200
+        container_ids: list[int] = list(
+            dict.fromkeys(container.id for container in args if container.id)
         )
+        for index in range(0, len(container_ids), batch_size):
+            self._handle_request(
+                method="DELETE",
+                url="container",
+                params={"ids": container_ids[index : index + batch_size]},
+            )
         for container in args:
             container.id = None
 
@@ -335,6 +623,37 @@ class PhantomClient:
 
         return playbooks_running_bool
 
+    def _poll_playbook_state(self, container: Container) -> tuple[bool, list[dict]]:
+        """Returns whether any playbooks are running on the container along with its pending approvals.
+        Approvals are read from the running playbook runs when the server includes them, otherwise they are
+        requested separately. Approvals are not requested once no playbooks are running.
+
+        Args:
+            container (Container): Initialized container on the Splunk SOAR server
+        """
+        params: dict = {
+            "_filter_container": container.id,
+            "_filter_status": "running",
+            "include_expensive": True,
+            "page_size": 50,
+        }
+        running_playbooks: list[dict] = self._handle_request(
+            method="GET", url="playbook_run", params=params, return_data_only=True
+        )
+        if not running_playbooks:
+            return False, []
+
+        if all("approvals" in playbook_run for playbook_run in running_playbooks):
+            pending_approvals: list[dict] = [
+                approval
+                for playbook_run in running_playbooks
+                for approval in playbook_run["approvals"]
+                if approval.get("status") == "pending"
+            ]
+            return True, pending_approvals
+
+        return True, self.check_approvals(container)
+
     def answer_approvals(
         self,
         container: Container,
@@ -448,14 +767,61 @@ class PhantomClient:
         if not container.id:
             raise ContainerNotInitialized
 
-        container.update(self.get_containers(params={"_filter_id": container.id})[0])
-
-        container.artifacts = self.get_artifacts(
-            params={"_filter_container__exact": container.id}
-        )
-        updated_playbooks: list[Playbook] = self.get_playbook_runs(
-            params={"_filter_container__exact": container.id, "include_expensive": True}
+        container_data: dict = self._get_container_bundle(container.id)
+        artifacts_data: list[dict] = container_data.pop("artifacts", None)
+        pins_data: list[dict] = container_data.pop("pins", None)
+        comments_data: list[dict] = container_data.pop("comments", None)
+        notes_data: list[dict] = container_data.pop("notes", None)
+        container.update(Container(**container_data))
+
+        # Sub-collections returned inline are used directly, otherwise fall back to their own endpoints.
+        # The remaining requests are independent of each other, so they are issued concurrently
+        fetches: list[Future] = []
+        artifacts_future: Future = None
+        if artifacts_data is None:
+            artifacts_future = self._executor.submit(
+                self.get_artifacts, params={"_filter_container__exact": container.id}
+            )
+            fetches.append(artifacts_future)
+        else:
+            container.artifacts = [
+                Artifact.from_dict(artifact) for artifact in artifacts_data
+            ]
+
+        playbooks_future: Future = self._executor.submit(
+            self.get_playbook_runs,
+            params={
+                "_filter_container__exact": container.id,
+                "include_expensive": True,
+            },
         )
+        fetches.append(playbooks_future)
+
+        if pins_data is None:
+            fetches.append(self._executor.submit(self.get_pins, container=container))
+        else:
+            container.pins.extend(Pin(**pin) for pin in pins_data)
+
+        if comments_data is None:
+            fetches.append(
+                self._executor.submit(self.get_comments, container=container)
+            )
+        else:
+            container.comments = [comment.get("comment") for comment in comments_data]
+
+        if notes_data is None:
+            fetches.append(self._executor.submit(self.get_notes, container=container))
+        else:
+            container.notes = [Note(**note) for note in notes_data]
+
+        # Surface the first failure from any of the concurrent requests
+        for fetch in fetches:
+            fetch.result()
+
+        if artifacts_future is not None:
+            container.artifacts = artifacts_future.result()
+
+        updated_playbooks: list[Playbook] = playbooks_future.result()
         for playbook in updated_playbooks:
             declared_playbook: Playbook = container.get_playbook(name=playbook.name)
             if declared_playbook:
@@ -463,9 +829,17 @@ class PhantomClient:
             else:
                 container.playbooks.append(playbook)
 
-        self.get_pins(container=container)
-        self.get_comments(container=container)
-        self.get_notes(container=container)
+    def _get_container_bundle(self, container_id: int) -> dict:
+        """Returns a single container record with any expensive fields the server expands inline
+
+        Args:
+            container_id (int): ID of an existing container on the Splunk SOAR server
+        """
+        return self._handle_request(
+            method="GET",
+            url=f"container/{container_id}",
+            params={"include_expensive": True},
+        )
 
     def get_playbook_name_from_id(self, id: int) -> str:
         """Returns the playbook name based on its id
@@ -476,9 +850,11 @@ class PhantomClient:
         Returns:
             name (str): Playbook name
         """
-        url = f"playbook/{id}"
-        response = self._handle_request(method="GET", url=url)
-        return response.get("name")
+        if id not in self._playbook_name_cache:
+            url = f"playbook/{id}"
+            response = self._handle_request(method="GET", url=url)
+            self._playbook_name_cache[id] = response.get("name")
+        return self._playbook_name_cache[id]
 
     def update_artifacts(self, container: Container, limit: int = 1000) -> None:
         """Updates the container's artifacts with fresh API data.
@@ -551,12 +927,15 @@ class PhantomClient:
             url=f"container/{container_id}/export?",
             params=params,
             return_json=False,
+            stream=True,
         )
 
         final_path: pathlib.Path = pathlib.Path(download_path) / file_name
 
-        with open(str(final_path.absolute()), "wb") as container_file:
-            container_file.write(response.content)
+        # Write the export in chunks so the archive is never fully buffered in memory
+        with response, open(str(final_path.absolute()), "wb") as container_file:
+            for chunk in response.iter_content(chunk_size=256 * 1024):
+                container_file.write(chunk)
 
         return final_path
 
@@ -575,11 +954,20 @@ class PhantomClient:
                 raise ValueError(
                     f"find_by_hash() type parameter must be either container or artifact"
                 )
+        cache_key: tuple[str, str] = (object_type, object_hash)
+        if cache_key in self._hash_cache:
+            self._hash_cache.move_to_end(cache_key)
+            return self._hash_cache[cache_key]
+
         params = {"_filter_hash": object_hash}
         response: list = self._handle_request(
             method="GET", url=f"{object_type}?", params=params, return_data_only=True
         )
         existing_object_id: int = response[0].get("id")
+
+        self._hash_cache[cache_key] = existing_object_id
+        if len(self._hash_cache) > 10000:
+            self._hash_cache.popitem(last=False)
         return existing_object_id
 
     def delete_artifact(self, *args: list[Union[Artifact, int]]) -> None:
@@ -615,7 +1003,7 @@ class PhantomClient:
         self._handle_request(
             method="POST",
             url=f"container/{container.id}",
-            data=container.get_container_only(),
+            json=container.get_container_only(),
         )
 
     def upload_file(self, **kwargs) -> None:
@@ -639,17 +1027,14 @@ class PhantomClient:
         if not file_location.exists():
             raise FileNotFoundError(f"File {file_path} not found. Check path provided")
 
-        file_data: bytes = open(file_location, "rb").read()
-
         initial_request_url = self.base_url + "upload_chunked"
-        files = {"file": (file_location.name, file_data)}
 
         # Uploading a file to a Container
         if container:
             data = {
                 "container_id": str(container.id),
             }
-            self.connector.session.headers.update(
+            self.session.headers.update(
                 {
                     "Referer": self.rest_url
                     + "mission/"
@@ -661,21 +1046,27 @@ class PhantomClient:
             # Uploading a Container
             params["import_container"] = True
 
-        response = self._handle_request(
-            method="POST",
-            url=initial_request_url,
-            data=data,
-            files=files,
-        )
+        # The file is streamed and hashed in chunks, so it is never held in memory whole
+        with open(file_location, "rb") as file_handle:
+            upload = _MultipartFileUpload(
+                data, file_location.name, file_handle, file_location.stat().st_size
+            )
+            response = self._handle_request(
+                method="POST",
+                url=initial_request_url,
+                data=upload,
+                headers={
+                    "Accept": "application/json",
+                    "Content-Type": upload.content_type,
+                },
+            )
+            sha256_digest: str = upload.hexdigest()
 
         upload_id = response["upload_id"]
         final_upload_url = self.base_url + "upload_chunked_complete"
 
         # indicator
-        sha256_digest = sha256(file_data).hexdigest()
         data = {"upload_id": upload_id, "sha256": sha256_digest}
-        # update headers for file upload
-        self.session.headers.update({"Accept-Encoding": "gzip, deflate, br"})
         self._handle_request(method="POST", url=final_upload_url, data=data)
 
     def get_playbook_id_from_name(self, playbook: Union[str, Playbook]) -> int:
@@ -693,27 +1084,36 @@ class PhantomClient:
         playbook_name: str = (
             playbook.name if isinstance(playbook, Playbook) else playbook
         )
-        params: dict = {"_filter_name__exact": playbook_name}
-        playbooks: list[Playbook] = self.get_playbooks(params=params)
-        if len(playbooks) > 1:
-            raise LookupError(
-                f"Playbook {playbook_name} has multiple matching playbooks. Provide more specific name"
-            )
-        if not playbooks:
-            raise LookupError(f"Playbook {playbook_name} not found on the server")
+        playbook_id: int = self._playbook_id_cache.get(playbook_name)
+        if not playbook_id:
+            params: dict = {"_filter_name__exact": playbook_name}
+            playbooks: list[Playbook] = self.get_playbooks(params=params)
+            if len(playbooks) > 1:
+                raise LookupError(
+                    f"Playbook {playbook_name} has multiple matching playbooks. Provide more specific name"
+                )
+            if not playbooks:
+                raise LookupError(f"Playbook {playbook_name} not found on the server")
+
+            playbook_id = playbooks[0].id
+            self._playbook_id_cache[playbook_name] = playbook_id
 
-        playbook_id: int = playbooks[0].id
         if isinstance(playbook, Playbook):
             playbook.id = playbook_id
 
         return playbook_id
 
+    def invalidate_playbook_cache(self) -> None:
+        """Clears the cached playbook name and ID lookups, e.g. after playbooks are imported or renamed"""
+        self._playbook_id_cache.clear()
+        self._playbook_name_cache.clear()
+
     def find_containers_from_playbook(
         self,
         playbook: Playbook,
         count: int = 1,
         successful: bool = True,
-        params: dict = {},
+        params: Optional[dict] = None,
     ) -> list[Container]:
         """Queries the API and returns a collection of containers that the given playbook has ran against. This function
         returns the most recent containers that the given playbook executed against.
@@ -762,13 +1162,16 @@ class PhantomClient:
         if not playbook.playbook_id and not playbook.name:
             raise AttributeError("Playbook missing a name or ID attribute")
 
-        params: dict = {"include_expensive": True, "page-size": 1}
-
-        if playbook.name:
-            params["_filter_name__exact"] = playbook.name
-
-        if playbook.id:
-            params["_filter_id__exact"] = playbook.id
+        params: dict = {
+            key: value
+            for key, value in (
+                ("include_expensive", True),
+                ("page-size", 1),
+                ("_filter_name__exact", playbook.name),
+                ("_filter_id__exact", playbook.id),
+            )
+            if value
+        }
 
         response: list = self._handle_request(
             url="playbook?", method="GET", params=params, return_data_only=True
@@ -777,7 +1180,7 @@ class PhantomClient:
 
     def get_asset_ids(self) -> list[int]:
         """Obtains a list of asset ids present in the connected Splunk SOAR environment"""
-        return [asset.id for asset in self.get_assets()]
+        return list(map(attrgetter("id"), self.get_assets()))
 
     def get_asset(self, asset_name: str) -> Asset:
         """Returns an asset based on its name attribute"""
@@ -804,100 +1207,134 @@ class PhantomClient:
         """Builds and stores the apps, actions, and asset configurations in Splunk SOAR."""
         self.action_builder = self._handle_request(method="GET", url="build_action")
 
+    def invalidate_catalog(self) -> None:
+        """Clears the cached action builder, apps, actions, assets, and playbook lookups so they are fetched again"""
+        self.action_builder = {}
+        self._apps_cache = None
+        self._apps_by_lower_name = {}
+        self._actions_cache = None
+        self._assets_cache = None
+        self.invalidate_playbook_cache()
+
     def get_apps(self) -> list[App]:
         """Returns a list of apps configured on the Splunk SOAR instance"""
-        if not self.action_builder:
-            self._init_action_builder()
-
-        apps: list[App] = []
-        for app in self.action_builder.get("apps"):
-            apps.append(App(**app))
-        return apps
+        if self._apps_cache is None:
+            if not self.action_builder:
+                self._init_action_builder()
+            self._apps_cache = [App(**app) for app in self.action_builder.get("apps")]
+            self._apps_by_lower_name = {}
+            for app in self._apps_cache:
+                self._apps_by_lower_name.setdefault(app.name.lower(), app)
+        return list(self._apps_cache)
 
     def get_app(self, app_name: str) -> App:
         """Returns an App object based off its name attribute"""
-        apps: list[App] = self.get_apps()
-        for app in apps:
-            if app_name.lower() in app.name.lower():
+        if self._apps_cache is None:
+            self.get_apps()
+        lower_app_name: str = app_name.lower()
+        app: App = self._apps_by_lower_name.get(lower_app_name)
+        if app is not None:
+            return app
+        # Fall back to the first app whose name contains the given name
+        for lower_name, app in self._apps_by_lower_name.items():
+            if lower_app_name in lower_name:
                 return app
         return None
 
     def get_actions(self) -> list[Action]:
         """Returns a list of actions configured on the Splunk SOAR instance"""
-        if not self.action_builder:
-            self._init_action_builder()
-
-        actions: list[Action] = []
-        for action in self.action_builder.get("actions"):
-            actions.append(Action(**action))
-        return actions
+        if self._actions_cache is None:
+            if not self.action_builder:
+                self._init_action_builder()
+            self._actions_cache = [
+                Action(**action) for action in self.action_builder.get("actions")
+            ]
+        return list(self._actions_cache)
 
     def get_assets(self) -> list[Asset]:
         """Returns a simple view of assets configured and available for actions"""
-        if not self.action_builder:
-            self._init_action_builder()
-
-        assets: list[Asset] = []
-        for asset in self.action_builder.get("assets"):
-            assets.append(Asset(**asset))
-        return assets
-
-    def get_containers(self, params: dict = {}) -> list[Container]:
+        if self._assets_cache is None:
+            if not self.action_builder:
+                self._init_action_builder()
+            self._assets_cache = [
+                Asset(**asset) for asset in self.action_builder.get("assets")
+            ]
+        return list(self._assets_cache)
+
+    def get_containers(self, params: Optional[dict] = None) -> list[Container]:
         """Returns a list of Container objects based on the REST parameters provided"""
-        containers: list[dict] = self._handle_request(
-            method="GET", url="container?", params=params, return_data_only=True
+        containers: Iterable[dict] = self._handle_request(
+            method="GET",
+            url="container?",
+            params=params,
+            return_data_only=True,
+            stream_data=True,
         )
-        return [Container(**container) for container in containers]
+        return [Container.from_dict(container) for container in containers]
 
-    def get_enriched_containers(self, params: dict = {}) -> list[Container]:
+    def get_enriched_containers(self, params: Optional[dict] = None) -> list[Container]:
         """Returns a list of fully enriched Containers objects based on the REST parameters provided for the container endpoint.
         The fully enriched containers will contain full information about artifacts, playbooks, actions, and logging.
         """
         containers: list[Container] = self.get_containers(params)
-        return [self.update_container_values(container) for container in containers]
+        # Containers are enriched in place, so the results of the concurrent updates are not needed
+        self._map_concurrently(self.update_container_values, containers, max_workers=32)
+        return containers
 
-    def get_artifacts(self, params: dict = {}) -> list[Artifact]:
+    def get_artifacts(self, params: Optional[dict] = None) -> list[Artifact]:
         """Returns a list of Artifact objects based on the REST parameters provided"""
-        artifacts: list[dict] = self._handle_request(
-            method="GET", url="artifact?", params=params, return_data_only=True
+        artifacts: Iterable[dict] = self._handle_request(
+            method="GET",
+            url="artifact?",
+            params=params,
+            return_data_only=True,
+            stream_data=True,
         )
-        return [Artifact(**artifact) for artifact in artifacts]
+        return [Artifact.from_dict(artifact) for artifact in artifacts]
 
-    def get_playbooks(self, params: dict = {}) -> list[Playbook]:
+    def get_playbooks(self, params: Optional[dict] = None) -> list[Playbook]:
         """Returns a list of Playbook objects based on the REST parameters provided"""
         playbooks: list[dict] = self._handle_request(
             method="GET", url="playbook?", params=params, return_data_only=True
         )
         return [Playbook(**playbook) for playbook in playbooks]
 
-    def get_playbook_runs(self, params: dict = None) -> list[Playbook]:
+    def get_playbook_runs(self, params: Optional[dict] = None) -> list[Playbook]:
         """Returns a list of Playbook Run Objects with actions and logging based on the REST parameters provided for the playbook_run endpoint."""
-        params["include_expensive"] = True
+        params = {**(params or {}), "include_expensive": True}
         playbooks_data: list[dict] = self._handle_request(
             method="GET", url="playbook_run?", params=params, return_data_only=True
         )
-        playbooks: list[Playbook] = []
-        for playbook in playbooks_data:
-            playbook_object: Playbook = Playbook(**playbook)
-            playbook_object.actions = self.get_action_runs(
-                {"_filter_playbook_run": playbook_object.id}
-            )
-            playbook_object.name = self.get_playbook_name_from_id(
-                playbook_object.playbook_id
-            )
-            playbook_object.logs = self.get_playbook_logs(playbook=playbook_object)
-            playbooks.append(playbook_object)
-        return playbooks
+        return self._map_concurrently(self._enrich_playbook_run, playbooks_data)
 
-    def get_app_runs(self, params: dict = {}) -> list[dict]:
+    def _enrich_playbook_run(self, playbook: dict) -> Playbook:
+        """Returns a Playbook object for a playbook_run record with its actions, name, and logs populated"""
+        playbook_object: Playbook = Playbook(**playbook)
+        playbook_object.actions = self.get_action_runs(
+            {"_filter_playbook_run": playbook_object.id}
+        )
+        playbook_object.name = self.get_playbook_name_from_id(
+            playbook_object.playbook_id
+        )
+        # Logs are only exposed per run at playbook_run/{id}/log, so they are fetched with the run's other lookups
+        # while get_playbook_runs enriches runs concurrently
+        playbook_object.logs = self.get_playbook_logs(playbook=playbook_object)
+        return playbook_object
+
+    def get_app_runs(self, params: Optional[dict] = None) -> list[dict]:
         """Returns a list[dict] of App Runs. Contains the record of the action_result with parameters"""
-        params["pretty"] = True
-        params["include_expensive"] = True
-        return self._handle_request(
-            method="GET", url="app_run?", params=params, return_data_only=True
+        params = {**(params or {}), "pretty": True, "include_expensive": True}
+        return list(
+            self._handle_request(
+                method="GET",
+                url="app_run?",
+                params=params,
+                return_data_only=True,
+                stream_data=True,
+            )
         )
 
-    def get_action_runs(self, params: dict = {}) -> list[Action]:
+    def get_action_runs(self, params: Optional[dict] = None) -> list[Action]:
         """Returns a list of Actions with preselected fields from its app execution if available. Actions obtained with this method
         will include additional information from the corresponding app_run endpoint related to any given action. This is intended
         to closely replicate the GUI experiencing of selecting a specific action within the mission explorer.
@@ -909,18 +1346,28 @@ class PhantomClient:
 
         if actions:
             action_ids: list[int] = [action.id for action in actions]
+            # Fetch the app runs of every action in one request and group them by their action run
+            app_runs: list[dict] = self.get_app_runs(
+                params={
+                    "_filter_action_run__in": json.dumps(action_ids),
+                    "page_size": 0,
+                }
+            )
+            app_runs_by_action: dict[int, list[dict]] = {}
+            for app_run in app_runs:
+                app_runs_by_action.setdefault(app_run.get("action_run"), []).append(
+                    app_run
+                )
 
             for action in actions:
-                    params: dict = {"_filter_action_run": action.id}
-                    app_runs: list[dict] = self.get_app_runs(params=params)
-                    for app_run in app_runs:
-                        action.app_name = app_run.get("app_name")
-                        action.app_run = app_run.get("id")
-                        action.app_version = app_run.get("app_version")
-                        action.exception_occurred = app_run.get("exception_occurred")
-                        action.app_message = app_run.get("message")
-                        action.result_summary = app_run.get("result_summary", {})
-                        action.result_data = app_run.get("result_data", [])
+                for app_run in app_runs_by_action.get(action.id, []):
+                    action.app_name = app_run.get("app_name")
+                    action.app_run = app_run.get("id")
+                    action.app_version = app_run.get("app_version")
+                    action.exception_occurred = app_run.get("exception_occurred")
+                    action.app_message = app_run.get("message")
+                    action.result_summary = app_run.get("result_summary", {})
+                    action.result_data = app_run.get("result_data", [])
         return actions
 
     def get_comments(self, container: Container) -> None:
@@ -966,16 +1413,11 @@ class PhantomClient:
         params: dict = {
             "_filter_container_id": container.id,
             "pretty": True,
-            "page": 0,
-            "page_size": 100,
             "order": "desc",
             "sort": "modified_time",
             "_annotation_container_attachments": True,
         }
-        container_notes: list[dict] = self._handle_request(
-            method="GET", url="note", params=params, return_data_only=True
-        )
-        container.notes = [Note(**note) for note in container_notes]
+        container.notes = [Note(**note) for note in self._paginate("note", params)]
 
     def create_note(self, container: Container, note: Note):
         """Creates a new note object on the container inside of the Splunk SOAR instance
@@ -1008,14 +1450,33 @@ class PhantomClient:
         and app errors will be capture"""
         # Playbook objects utilize the run_id
         if playbook.id:
-            params: dict = {"page_size": 0, "sort": "time"}
-            return self._handle_request(
+            params: dict = {"sort": "time"}
+            return list(self._paginate(f"playbook_run/{playbook.id}/log", params))
+        return []
+
+    def _paginate(self, url: str, params: Optional[dict] = None, page_size: int = 500):
+        """Yields the items of a list endpoint one page at a time rather than requesting every row in a single response
+
+        Args:
+            url (str): API endpoint of the list
+            params (dict, optional): REST parameters applied to every page
+            page_size (int): Number of items to request per page. Defaults to 500
+        """
+        page: int = 0
+        while True:
+            response: dict = self._handle_request(
                 method="GET",
-                url=f"playbook_run/{playbook.id}/log",
-                params=params,
-                return_data_only=True,
+                url=url,
+                params={**(params or {}), "page": page, "page_size": page_size},
             )
-        return []
+            page_data: list[dict] = response.get("data", [])
+            yield from page_data
+
+            page += 1
+            if len(page_data) < page_size or page >= response.get(
+                "num_pages", page + 1
+            ):
+                return
 
     def _handle_request(
         self,
@@ -1033,10 +1494,12 @@ class PhantomClient:
             params (dict, optional): Parameters for encoding in requests
             headers (dict, optional): Headers for HTTP Request
             stream (bool, optional): Obtain raw_socket from the server
-            json (dict, optional): Used for passing dicts without serializing
+            json (dict | PhantomObject, optional): Used for passing dicts or PhantomObjects without serializing
             files (dict, optional): Used for uploading files
             return_json (bool, optional): By default, return the JSON. Otherwise,
                                           return the response object
+            stream_data (bool, optional): Return an iterator parsing the items of the data list as they are
+                                          received. Falls back to return_data_only when ijson is not installed
 
         Returns:
             Union[dict, Response]: JSON loaded response from the server. Utilize the return_data_only parameter to determine the type.
@@ -1044,7 +1507,7 @@ class PhantomClient:
 
         """
         data: dict = kwargs.get("data", {})
-        params: dict = kwargs.get("params", {})
+        params: dict = kwargs.get("params") or {}
         headers: dict = kwargs.get("headers", {"Accept": "application/json"})
         stream: bool = kwargs.get("stream", False)
         json_data: Union[PhantomObject, dict] = kwargs.get("json", {})
@@ -1052,75 +1515,228 @@ class PhantomClient:
         allow_redirects: bool = kwargs.get("allow_redirects", False)
         return_json: bool = kwargs.get("return_json", True)
         return_data_only: bool = kwargs.get("return_data_only", False)
+        # Incrementally parsing the data list requires ijson, otherwise the whole body is decoded at once
+        stream_data: bool = kwargs.get("stream_data", False) and ijson is not None
+        if stream_data:
+            stream = True
 
-        for key, value in params.items():
-            if key not in ["start_time", "sort", "order"] and "__in" not in key:
-                if isinstance(value, str):
-                    params[key]: str = json.dumps(value)
+        # Build a new dict so the caller's params are never modified
+        params = {
+            key: (
+                _dump_json_string(value)
+                if isinstance(value, str)
+                and key not in _UNQUOTED_PARAMS
+                and "__in" not in key
+                else value
+            )
+            for key, value in params.items()
+        }
 
         # Serialize PhantomObjects to JSON compatible format
         if isinstance(data, PhantomObject):
-            data: str = data.toJson()
+            data: bytes = data.toBytes()
+        if isinstance(json_data, PhantomObject):
+            json_data: dict = json_data.toDict()
+
+        # Pre-serialize JSON bodies with orjson when it is installed
+        if json_data and orjson is not None:
+            data = orjson.dumps(json_data, option=orjson.OPT_NON_STR_KEYS)
+            headers = {**headers, "Content-Type": "application/json"}
+            json_data = {}
 
-        if self.base_url not in url:
-            url = self.base_url + "rest/" + url
+        url = self._url(url)
 
-        try:
-            request_func = getattr(self.session, method.lower())
-        except AttributeError:
+        session_method: str = _SESSION_METHODS.get(method.upper())
+        if session_method is None:
             raise AttributeError(
                 f"Invalid requests method {method}, use GET/POST/DELETE"
             )
+        request_func = getattr(self.session, session_method)
 
-        response = request_func(
-            url=url,
-            data=data,
-            params=params,
-            headers=headers,
-            stream=stream,
-            json=json_data,
-            files=files,
-            allow_redirects=allow_redirects,
-            hooks={"response": self._generate_log},
-            verify=self._TLS_VERIFY,
-        )
+        # Only bodies held in memory are sent over HTTP/2, uploads stay on the session
+        if (
+            self._http2
+            and not stream
+            and not files
+            and isinstance(data, (dict, str, bytes))
+        ):
+            response = self._send_http2(
+                method=method,
+                url=url,
+                data=data,
+                params=params,
+                headers=headers,
+                json_data=json_data,
+                allow_redirects=allow_redirects,
+            )
+        else:
+            response = request_func(
+                url=url,
+                data=data,
+                params=params,
+                headers=headers,
+                stream=stream,
+                json=json_data,
+                files=files,
+                allow_redirects=allow_redirects,
+                hooks={"response": self._generate_log},
+                verify=self._request_verify,
+            )
 
-        try:
-            response.raise_for_status()
-        except HTTPError as http_exception:
-            raise ServerException(response=response) from http_exception
+        if response.status_code in _ERROR_STATUS_CODES:
+            raise ServerException(response=response, body=_load_error_body(response))
 
-        if return_json:
-            if return_data_only:
-                return response.json().get("data")
-            return response.json()
+        if stream_data:
+            return _iter_response_data(response)
 
-        return response
+        if not return_json:
+            return response
 
-    def _generate_log(self, response: Response, *args, **kwargs) -> None:
-        """Formats logs for usage in error handling and general debugging. Requests are stored in the self.requests_log attribute"""
+        if return_data_only:
+            return _load_json(response).get("data")
+        return _load_json(response)
 
-        def format_headers(arg: CaseInsensitiveDict[str]) -> str:
-            return "\n".join(f"{k}: {v}" for k, v in arg.items())
+    def _send_http2(
+        self,
+        method: str,
+        url: str,
+        data: Union[dict, str, bytes],
+        params: dict,
+        headers: dict,
+        json_data: dict,
+        allow_redirects: bool,
+    ) -> Response:
+        """Sends a request over the HTTP/2 client using the session's headers and cookies. The response is converted
+        to a requests.Response so error handling and logging are shared with the session transport
+        """
+        if self._http2_client is None:
+            # Requests run on several worker threads, so the client is created and given the authenticated
+            # session's cookies exactly once. Cookies set by later responses are kept by the httpx client itself
+            with self._http2_lock:
+                if self._http2_client is None:
+                    self._http2_client = httpx.Client(
+                        http2=True,
+                        verify=self._TLS_VERIFY,
+                        cookies=httpx.Cookies(self.session.cookies),
+                        limits=httpx.Limits(
+                            max_keepalive_connections=_CONNECTION_POOL_SIZE,
+                            max_connections=_CONNECTION_POOL_SIZE,
+                        ),
+                    )
 
-        self.requests_log.append(
-            textwrap.dedent(
-                """
-            ─────────────── Request ───────────────
-            {req.method} {req.url}
-            {reqhdrs}
-            {req_body_json}
-            ─────────────── Response ───────────────
-            {res.status_code} {res.reason} {res.url}
-            {resp_body_json}
-            ────────────────────────────────────────
+        body: dict = {}
+        if isinstance(data, (str, bytes)):
+            body["content"] = data
+        elif data:
+            body["data"] = data
+        elif json_data:
+            body["json"] = json_data
+
+        # Connection-specific headers are not allowed in HTTP/2
+        http2_headers: dict = {
+            key: value
+            for key, value in {**self.session.headers, **headers}.items()
+            if key.lower() not in ("connection", "keep-alive")
+        }
+        http2_response = self._http2_client.request(
+            method,
+            url,
+            params=params,
+            headers=http2_headers,
+            follow_redirects=allow_redirects,
+            **body,
+        )
+
+        request = requests.PreparedRequest()
+        request.method = http2_response.request.method
+        request.url = str(http2_response.request.url)
+        request.headers = CaseInsensitiveDict(http2_response.request.headers)
+        request.body = http2_response.request.content
+
+        response = Response()
+        response.status_code = http2_response.status_code
+        response.reason = http2_response.reason_phrase
+        response.headers = CaseInsensitiveDict(http2_response.headers)
+        response.url = str(http2_response.url)
+        response.encoding = http2_response.encoding
+        response._content = http2_response.content
+        response.request = request
+
+        self._generate_log(response)
+        return response
+
+    def _map_concurrently(self, func, items: list, max_workers: int = 8) -> list:
+        """Applies func to every item on worker threads and returns the results in order. Each call uses its own pool,
+        so fan-outs nested inside other concurrent requests cannot starve each other of workers
         """
-            ).format(
-                req=response.request,
-                res=response,
-                req_body_json=response.request.body,
-                reqhdrs=format_headers(response.request.headers),
-                reshdrs=format_headers(response.headers),
-                resp_body_json=response.text,
+        if len(items) <= 1:
+            return [func(item) for item in items]
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+            return list(executor.map(func, items))
+
+    def _url(self, path: str) -> str:
+        """Returns the full URL for a REST endpoint path. Absolute URLs are returned unchanged.
+        Resolved URLs are cached since the same endpoints are requested repeatedly"""
+        url: str = self._url_cache.get(path)
+        if url is None:
+            url = (
+                path
+                if path.startswith(_URL_SCHEMES)
+                else self.rest_url + path.lstrip("/")
+            )
+            # Paths embedding object IDs are unbounded, so reset rather than grow indefinitely
+            if len(self._url_cache) >= 1024:
+                self._url_cache.clear()
+            self._url_cache[path] = url
+        return url
+
+    def _generate_log(self, response: Response, *args, **kwargs) -> None:
+        """Records responses in the self.requests_log attribute for error handling and general debugging when debug_log
+        is enabled. Each entry is a small tuple of (method, url, request headers, request body, status code, reason,
+        response url, response body) with bodies truncated, so the log never holds on to responses or their
+        connections. Entries are only formatted when format_requests_log() is called"""
+        if not self._debug_log:
+            return
+        request = response.request
+        # The body of a streamed response has not been read yet and must be left for the caller
+        if kwargs.get("stream", False):
+            response_body: str = "<streamed response>"
+        else:
+            response_body = _truncate_body(response.content)
+        self.requests_log.append(
+            (
+                request.method,
+                request.url,
+                dict(request.headers),
+                _truncate_body(request.body),
+                response.status_code,
+                response.reason,
+                response.url,
+                response_body,
+            )
+        )
+
+    def format_requests_log(self) -> str:
+        """Returns the recorded requests and responses formatted for reading"""
+        return "\n".join(
+            _LOG_TEMPLATE.format(
+                method=method,
+                url=url,
+                reqhdrs="\n".join(f"{k}: {v}" for k, v in headers.items()),
+                req_body_json=request_body,
+                status_code=status_code,
+                reason=reason,
+                res_url=response_url,
+                resp_body_json=response_body,
             )
+            for (
+                method,
+                url,
+                headers,
+                request_body,
+                status_code,
+                reason,
+                response_url,
+                response_body,
+            ) in self.requests_log
         )
@@ -2,29 +2,35 @@ import requests
 import textwrap
 import colorama
 
+# ANSI codes wrapped around error messages, looked up once rather than on every exception
+_RED: str = colorama.Fore.RED
+_RESET: str = colorama.Style.RESET_ALL
+
 
 class ServerException(Exception):
-    def __init__(self, response: requests.Response):
-        failure_reason: str = response.json().get("message")
+
+    def __init__(self, response: requests.Response, body: dict = None):
+        # The body is decoded by the client when available so the response is not parsed twice
+        if body is None:
+            body = response.json()
+        failure_reason: str = body.get("message")
 
         self.error_code = response.status_code
         if self.error_code != 400:
             self.error_msg = f"""{response.request.method} {response.reason}  {failure_reason} {response.request.body}"""
         else:
-            self.error_msg = textwrap.dedent(
-                f"""
+            self.error_msg = textwrap.dedent(f"""
             ─────────────── Request ───────────────
             {response.request.method} {response.request.url}
             {response.request.body}
             ─────────────── Response ───────────────
             {response.status_code} {response.reason} {response.url}
-            {response.json()}
+            {body}
             ────────────────────────────────────────
-            """
-            )
+            """)
         Exception.__init__(
             self,
-            f"{colorama.Fore.RED}{self.error_code}{colorama.Style.RESET_ALL}{self.error_msg}",
+            f"{_RED}{self.error_code}{_RESET}{self.error_msg}",
         )
 
 
@@ -57,9 +63,7 @@ class PlaybookException(Exception):
     def __init__(self, playbook) -> None:
         exceptions: list[dict] = playbook.get_exceptions()
         error_message: str = "".join([exc.get("message") for exc in exceptions])
-        super().__init__(
-            f"{colorama.Fore.RED}{error_message}{colorama.Style.RESET_ALL}"
-        )
+        super().__init__(f"{_RED}{error_message}{_RESET}")
 
 
 class AuthenticationError(Exception):
@@ -2,6 +2,70 @@ from .exceptions import PhantomObjectRequired
 from typing import Optional
 from typing import Union
 import json
+import sys
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Default attribute values per class, captured from a keyword-less instance for from_dict()
+_FIELD_DEFAULTS: dict[type, dict] = {}
+
+# Field value types serialized as-is by toDict()
+_PLAIN_TYPES: frozenset[type] = frozenset([str, int, float, bool])
+
+# Sentinel returned by the generated toDict() for fields that were never assigned
+_MISSING: object = object()
+
+
+def _convert_value(value):
+    """Converts a field value that is not of a plain type for toDict()"""
+    value_type: type = type(value)
+    if value_type is dict or isinstance(value, dict):
+        return {
+            k: v.toDict() if isinstance(v, PhantomObject) else v
+            for k, v in value.items()
+        }
+    if value_type is list or isinstance(value, list):
+        return [v.toDict() if isinstance(v, PhantomObject) else v for v in value]
+    if isinstance(value, PhantomObject):
+        return value.toDict()
+    return value
+
+
+def _generate_to_dict(cls):
+    """Generates a toDict() for cls that reads each of its fields by name, avoiding the loop over _FIELDS of
+    PhantomObject.toDict(). Fields left unassigned are skipped
+    """
+    lines: list[str] = [
+        "def toDict(self) -> dict:",
+        "    data: dict = {}",
+    ]
+    for field in cls._FIELDS:
+        lines += [
+            f"    value = getattr(self, {field!r}, _MISSING)",
+            "    if value is not _MISSING and value:",
+            f"        data[{field!r}] = value if type(value) in _PLAIN_TYPES else _convert_value(value)",
+        ]
+    if cls.__dictoffset__:
+        # Subclasses without __slots__ keep undeclared attributes in __dict__, which are serialized as well
+        lines += [
+            "    for key, value in vars(self).items():",
+            "        if value:",
+            "            data[key] = value if type(value) in _PLAIN_TYPES else _convert_value(value)",
+        ]
+    lines.append("    return data")
+    namespace: dict = {}
+    exec(
+        compile("\n".join(lines), f"<{cls.__name__}.toDict>", "exec"),
+        globals(),
+        namespace,
+    )
+    to_dict = namespace["toDict"]
+    to_dict.__qualname__ = f"{cls.__qualname__}.toDict"
+    return to_dict
 
 
 class PhantomObject:
@@ -10,20 +74,74 @@ class PhantomObject:
     Features of subclassing:
      - JSON Serializable: method to dump class directly into API calls
      - Allows for usage of the __in__ operator
+     - Attributes are stored in __slots__, so only declared fields may be assigned unless a subclass omits __slots__
     """
 
+    __slots__ = ()
+    # Every slot declared along the MRO, in declaration order. Set for each subclass by __init_subclass__
+    _FIELDS: tuple[str, ...] = ()
+    # Low-cardinality string fields repeated across many objects, interned so instances share one copy
+    _INTERNED_FIELDS: tuple[str, ...] = ()
+
+    def __init_subclass__(cls, **kwargs) -> None:
+        super().__init_subclass__(**kwargs)
+        fields: list[str] = []
+        for klass in reversed(cls.__mro__):
+            for field in klass.__dict__.get("__slots__", ()):
+                if field not in fields:
+                    fields.append(field)
+        cls._FIELDS = tuple(fields)
+        if "toDict" not in cls.__dict__:
+            cls.toDict = _generate_to_dict(cls)
+
     def __in__(self, object, arg) -> Union[bool, None]:
-        return arg in object.__dict__
+        return arg in object._FIELDS
+
+    @classmethod
+    def from_dict(cls, data: dict):
+        """Builds an object from a trusted API response without replaying __init__ for every field.
+        Only keys matching an attribute name are copied, so this suits classes whose attributes share the API's key names
+        """
+        defaults: dict = _FIELD_DEFAULTS.get(cls)
+        if defaults is None:
+            default_object = cls()
+            defaults = _FIELD_DEFAULTS[cls] = {
+                field: getattr(default_object, field) for field in cls._FIELDS
+            }
+        obj = cls.__new__(cls)
+        for key, value in defaults.items():
+            if key in data:
+                value = data[key]
+            elif isinstance(value, (list, dict)):
+                # Mutable defaults must not be shared between instances
+                value = value.copy()
+            setattr(obj, key, value)
+        obj._intern_fields()
+        return obj
+
+    def _intern_fields(self) -> None:
+        """Replaces the string values of _INTERNED_FIELDS with their interned copies"""
+        for field in self._INTERNED_FIELDS:
+            value = getattr(self, field)
+            if type(value) is str:
+                setattr(self, field, sys.intern(value))
 
     def update(self, object=None, **kwargs) -> None:
         """Allows updating from either unpacking API response or another object"""
         if object:
-            for k, v in object.__dict__.items():
-                if v:
-                    self.__dict__[k] = v
+            for k in object._FIELDS:
+                v = getattr(object, k, None)
+                # Unset fields hold None or an empty default collection, neither of which should overwrite values.
+                # Other falsy values such as 0 and False are real values and are copied
+                if v is None or (not v and isinstance(v, (list, dict))):
+                    continue
+                setattr(self, k, v)
         else:
+            # API responses carry keys without a matching slot, which are skipped like in from_dict()
+            fields: tuple = self._FIELDS
             for k, v in kwargs.items():
-                self.__dict__[k] = v
+                if k in fields:
+                    setattr(self, k, v)
 
     def __str__(self) -> str:
         return json.dumps(self.toDict())
@@ -34,29 +152,56 @@ class PhantomObject:
     def toJson(self) -> str:
         return self.__str__()
 
+    def toBytes(self) -> bytes:
+        """Returns the object serialized as JSON bytes, ready to send as a request body"""
+        if orjson is not None:
+            return orjson.dumps(self.toDict(), option=orjson.OPT_NON_STR_KEYS)
+        return json.dumps(self.toDict()).encode()
+
     def toDict(self) -> dict:
+        """Returns the set fields of the object as a dict. Subclasses use a generated equivalent, see _generate_to_dict()"""
         data: dict = {}
-        for key, value in vars(self).items():
+        for key in self._FIELDS:
+            value = getattr(self, key, None)
+            if value:
+                # Most fields hold plain values, which are checked by exact type before any isinstance() calls
+                data[key] = (
+                    value if type(value) in _PLAIN_TYPES else _convert_value(value)
+                )
+        for key, value in getattr(self, "__dict__", {}).items():
             if value:
-                if isinstance(value, dict):
-                    data[key] = {
-                        k: v.toDict() if isinstance(v, PhantomObject) else v
-                        for k, v in value.items()
-                    }
-                elif isinstance(value, list):
-                    data[key] = [
-                        v.toDict() if isinstance(v, PhantomObject) else v for v in value
-                    ]
-                elif isinstance(value, PhantomObject):
-                    data[key] = value.toDict()
-                else:
-                    data[key] = value
+                data[key] = (
+                    value if type(value) in _PLAIN_TYPES else _convert_value(value)
+                )
         return data
 
 
 class App(PhantomObject):
     """Represents an App configuration object within Splunk SOAR"""
 
+    __slots__ = (
+        "name",
+        "id",
+        "tags",
+        "appid",
+        "release_tag",
+        "app_version",
+        "contributors",
+        "description",
+        "directory",
+        "draft_mode",
+        "custom_made",
+        "install_time",
+        "known_versions",
+        "latest_tested_versions",
+        "product_name",
+        "product_vendor",
+        "publisher",
+        "type",
+        "python_version",
+        "product_version_regex",
+    )
+
     def __init__(self, **kwargs):
         self.name: str = kwargs.get("name")
         self.id: int = kwargs.get("id")
@@ -81,6 +226,45 @@ class App(PhantomObject):
 
 
 class Action(PhantomObject):
+    __slots__ = (
+        "id",
+        "name",
+        "action",
+        "app_run",
+        "app",
+        "app_name",
+        "asset_name",
+        "app_version",
+        "container",
+        "container_name",
+        "create_time",
+        "creator",
+        "handle",
+        "end_time",
+        "pretty_end_time",
+        "exception_occurred",
+        "message",
+        "app_message",
+        "playbook_run",
+        "extra_data",
+        "result_summary",
+        "result_data",
+        "start_time",
+        "pretty_start_time",
+        "status",
+        "version",
+        "effective_user",
+        "effective_user_name",
+        "playbook",
+    )
+
+    _INTERNED_FIELDS: tuple[str, ...] = (
+        "action",
+        "app_name",
+        "asset_name",
+        "status",
+    )
+
     def __init__(self, **kwargs):
         """Simplified Object between Action, ActionResult, & AppRun"""
         super().__init__()
@@ -113,10 +297,60 @@ class Action(PhantomObject):
         self.effective_user: int = kwargs.get("effective_user")
         self.effective_user_name: str = kwargs.get("_pretty_effective_user")
         self.playbook: str = kwargs.get("playbook_run")
-        self.status: str = kwargs.get("status")
+        self._intern_fields()
 
 
 class Artifact(PhantomObject):
+    __slots__ = (
+        "label",
+        "name",
+        "id",
+        "tags",
+        "cef",
+        "data",
+        "container",
+        "cef_types",
+        "description",
+        "end_time",
+        "ingest_app_id",
+        "kill_chain",
+        "owner_id",
+        "playbook_run_id",
+        "severity_id",
+        "source_data_identifier",
+        "start_time",
+        "type",
+        "update_time",
+        "version",
+        "in_case",
+        "parent_container_id",
+        "parent_artifact_id",
+        "hash",
+        "create_time",
+        "container_id",
+    )
+
+    _INTERNED_FIELDS: tuple[str, ...] = (
+        "label",
+        "type",
+        "kill_chain",
+        "severity_id",
+    )
+
+    # Fields copied by get_creation_artifact(), every other field keeps its default
+    _CREATION_FIELDS: tuple[str, ...] = (
+        "name",
+        "label",
+        "tags",
+        "cef",
+        "data",
+        "cef_types",
+        "description",
+        "owner_id",
+        "type",
+        "version",
+    )
+
     def __init__(self, **kwargs):
         super().__init__()
         self.label = kwargs.get("label")
@@ -125,10 +359,9 @@ class Artifact(PhantomObject):
         # Check/Retrieve default values
         self.tags = kwargs.get("tags", [])
         self.cef = kwargs.get("cef", {})
-        self.data = kwargs.get("data", [])
+        self.data: dict = kwargs.get("data", {})
         self.container: int = kwargs.get("container")
         self.cef_types: dict = kwargs.get("cef_types", {})
-        self.data: dict = kwargs.get("data", {})
         self.description: str = kwargs.get("description")
         self.end_time: str = kwargs.get("end_time")
         self.ingest_app_id: int = kwargs.get("ingest_app_id")
@@ -146,37 +379,60 @@ class Artifact(PhantomObject):
         self.parent_artifact_id: int = kwargs.get("parent_artifact_id")
         self.hash: str = kwargs.get("hash")
         self.create_time: str = kwargs.get("create_time")
+        # Assigned when the artifact is added to or created on a container
+        self.container_id: int = kwargs.get("container_id")
+        self._intern_fields()
 
     def get_creation_artifact(self):
-        """Returns a clean artifact for creation. This is used to accurately place create time"""
-        return Artifact(
-            name=self.name,
-            label=self.label,
-            tags=self.tags,
-            cef=self.cef,
-            data=self.data,
-            cef_types=self.cef_types,
-            description=self.description,
-            owner_id=self.owner_id,
-            type=self.type,
-            version=self.version,
+        """Returns a clean artifact for creation. This is used to accurately place create time.
+        Built on every call rather than cached, since artifacts are edited freely between requests
+        """
+        return Artifact.from_dict(
+            {field: getattr(self, field) for field in self._CREATION_FIELDS}
         )
 
     def __eq__(self, comp_artifact):
-        return all(
-            [
-                self.name == comp_artifact.name,
-                self.label == comp_artifact.label,
-                self.container_id == comp_artifact.container_id,
-            ]
+        if not isinstance(comp_artifact, Artifact):
+            return NotImplemented
+        return (self.name, self.label, self.container_id) == (
+            comp_artifact.name,
+            comp_artifact.label,
+            comp_artifact.container_id,
         )
 
     def __hash__(self):
-        """@todo look through previous scripts to find appropriate hashing for equality comparisons"""
-        return hash(self.name + self.label + self.id)
+        # Hashes the same attributes __eq__ compares so equal artifacts share a hash
+        return hash((self.name, self.label, self.container_id))
 
 
 class Asset(PhantomObject):
+    __slots__ = (
+        "action_whitelist",
+        "automation_broker",
+        "concurrency_limit",
+        "configuration",
+        "description",
+        "effective_user",
+        "id",
+        "name",
+        "primary_voting",
+        "secondary_voting",
+        "tags",
+        "tenants",
+        "token",
+        "type",
+        "validation",
+        "version",
+        "apps",
+        "product_name",
+        "product_vendor",
+        "disabled",
+        "internal",
+        "config",
+        "product_version",
+        "app",
+    )
+
     def __init__(self, **kwargs):
         self.action_whitelist: dict = kwargs.get("action_whitelist", {})
         self.automation_broker: str = kwargs.get("automation_broker")
@@ -205,6 +461,37 @@ class Asset(PhantomObject):
 
 
 class Playbook(PhantomObject):
+    __slots__ = (
+        "actions",
+        "name",
+        "id",
+        "playbook_id",
+        "prompts",
+        "status",
+        "misc",
+        "run_data",
+        "targets",
+        "start_time",
+        "endpoint",
+        "action_exec",
+        "container",
+        "ip_address",
+        "log_level",
+        "message",
+        "test_mode",
+        "last_artifact",
+        "version",
+        "effective_user",
+        "node_guid",
+        "playbook_run_batch",
+        "parent_run",
+        "inputs",
+        "outputs",
+        "run_id",
+        "update_time",
+        "logs",
+    )
+
     def __init__(
         self,
         **kwargs,
@@ -263,11 +550,11 @@ class Playbook(PhantomObject):
 
     @property
     def get_parent_playbook_id(self) -> int:
-        return self.get_parent_playbook("id")
+        return self._get_parent_playbook_value("parent_playbook_run_id")
 
     @property
     def get_parent_playbook_name(self) -> str:
-        return self.get_parent_playbook("name")
+        return self._get_parent_playbook_value("parent_playbook_name")
 
     @property
     def get_action_ids(self) -> list[int]:
@@ -276,7 +563,7 @@ class Playbook(PhantomObject):
     @property
     def exception_occurred(self) -> bool:
         """Checks for message_type 0 in the playbook logs to indicate if an exception has occurred"""
-        return bool(self.get_exceptions())
+        return any(log.get("message_type") == 0 for log in self.logs)
 
     def get_exceptions(self) -> list[dict]:
         return [log for log in self.logs if log.get("message_type") == 0]
@@ -289,18 +576,19 @@ class Playbook(PhantomObject):
                 f'get_parent_playbook only excepts either "name" or "id" arguments'
             )
 
-        parent_playbook = self.misc.get("parent_playbook_run")
-        if not parent_playbook:
-            return None
-
         if "name" in args:
-            return parent_playbook.get("parent_playbook_name")
+            return self._get_parent_playbook_value("parent_playbook_name")
 
         if "id" in args:
-            return parent_playbook.get("parent_playbook_run_id")
+            return self._get_parent_playbook_value("parent_playbook_run_id")
 
         return None
 
+    def _get_parent_playbook_value(self, key: str) -> Union[int, str]:
+        """Returns a value of the parent_playbook_run record, if the playbook was launched by another playbook"""
+        parent_playbook: dict = self.misc.get("parent_playbook_run")
+        return parent_playbook.get(key) if parent_playbook else None
+
     def get_action(self, name: str) -> Action:
         """Returns a given action from a playbook"""
         for action in self.actions:
@@ -310,6 +598,13 @@ class Playbook(PhantomObject):
 
 
 class Pin(PhantomObject):
+    __slots__ = (
+        "message",
+        "data",
+        "style",
+        "type",
+    )
+
     def __init__(self, **kwargs):
         super().__init__()
         self.message = kwargs.get("message")
@@ -319,6 +614,28 @@ class Pin(PhantomObject):
 
 
 class Note(PhantomObject):
+    __slots__ = (
+        "artifact",
+        "artifact_name",
+        "author",
+        "container",
+        "container_attachments",
+        "content",
+        "id",
+        "modified_time",
+        "format",
+        "type",
+        "phase",
+        "task",
+        "task_name",
+        "title",
+        "_pretty_author",
+        "_pretty_container",
+        "_pretty_create_time",
+        "_pretty_phase",
+        "_pretty_task",
+    )
+
     def __init__(self, **kwargs):
         super().__init__()
         self.artifact: int = kwargs.get("artifact")
@@ -346,6 +663,78 @@ class Container(PhantomObject):
     """Represents a container within Splunk SOAR. Creation requires name & label attributes. Optionally, the id attribute may be used to
     reference and existing container a Splunk SOAR instance."""
 
+    __slots__ = (
+        "name",
+        "label",
+        "id",
+        "run_auto",
+        "tags",
+        "custom_fields",
+        "description",
+        "artifacts",
+        "sensitivity",
+        "playbooks",
+        "pins",
+        "create_time",
+        "open_time",
+        "end_time",
+        "owner_id",
+        "role_id",
+        "kill_chain",
+        "severity_id",
+        "severity",
+        "source_data_identifier",
+        "start_time",
+        "status_id",
+        "workflow_name",
+        "owner_name",
+        "container_type",
+        "in_case",
+        "current_phase_id",
+        "tenant_id",
+        "parent_container_id",
+        "node_guid",
+        "status",
+        "artifact_update_time",
+        "asset_id",
+        "close_time",
+        "closing_owner_id",
+        "container_update_time",
+        "kill_Chain",
+        "created",
+        "audit_logs",
+        "comments",
+        "notes",
+        "data",
+    )
+
+    _INTERNED_FIELDS: tuple[str, ...] = (
+        "label",
+        "sensitivity",
+        "status",
+        "severity",
+        "kill_chain",
+        "container_type",
+        "workflow_name",
+    )
+
+    # Fields copied by get_creation_container(), every other field keeps its default
+    _CREATION_FIELDS: tuple[str, ...] = (
+        "name",
+        "label",
+        "severity",
+        "sensitivity",
+        "owner_name",
+        "owner_id",
+        "description",
+        "kill_chain",
+        "workflow_name",
+        "custom_fields",
+        "container_type",
+        "status",
+        "id",
+    )
+
     def __init__(self, **kwargs):
         super().__init__()
         self.name: str = kwargs.get("name")
@@ -384,13 +773,13 @@ class Container(PhantomObject):
         self.close_time: str = kwargs.get("close_time")
         self.closing_owner_id: str = kwargs.get("closing_owner_id")
         self.container_update_time: str = kwargs.get("container_update_time")
-        self.create_time: str = kwargs.get("create_time")
         self.kill_Chain: str = kwargs.get("kill_chain")
         self.created: str = kwargs.get("created")
         self.audit_logs: list = kwargs.get("audit_logs", [])
         self.comments: list[str] = kwargs.get("comments", [])
         self.notes: list[Note] = kwargs.get("notes", [])
         self.data: list[dict] = kwargs.get("data", {})
+        self._intern_fields()
 
     @property
     def artifact_count(self) -> int:
@@ -403,30 +792,30 @@ class Container(PhantomObject):
     @property
     def artifact_ids(self) -> list:
         """Returns a list of artifact IDs associated with the container"""
-        return list(set([artifact.id for artifact in self.artifacts]))
+        return list({artifact.id for artifact in self.artifacts})
 
     @property
     def action_names(self) -> list[str]:
         """Returns a unique list of action names that have ran on the container"""
-        action_names: list[str] = []
-        for playbook in self.playbooks:
-            [action_names.append(action.name) for action in playbook.actions]
-        return list(set(action_names))
+        return list(
+            {action.name for playbook in self.playbooks for action in playbook.actions}
+        )
 
     @property
     def playbook_names(self) -> list[str]:
         """Returns a unique list of playbook names that have ran on the container"""
-        return list(set([playbook.name for playbook in self.playbooks]))
+        return list({playbook.name for playbook in self.playbooks})
 
     def add_artifact(self, *args: list[Artifact]) -> None:
-        """Add a series of artifact(s) to the container"""
+        """Add a series of artifact(s) to the container. Nothing is added if any argument is not an Artifact"""
+        if not all(isinstance(arg, Artifact) for arg in args):
+            raise PhantomObjectRequired(
+                "container.add_artifact() requires an Artifact object"
+            )
+        container_id: int = self.id
         for arg in args:
-            if not isinstance(arg, Artifact):
-                raise PhantomObjectRequired(
-                    "container.add_artifact() requires an Artifact object"
-                )
-            arg.container_id = self.id
-            self.artifacts.append(arg)
+            arg.container_id = container_id
+        self.artifacts.extend(args)
 
     def get_creation_container(
         self,
@@ -434,24 +823,13 @@ class Container(PhantomObject):
         tags_included: Optional[bool] = False,
     ):
         """Returns a clean container object for creation in the REST API.
-        Artifacts are optionally included. Does not modify base object
+        Artifacts are optionally included. Does not modify base object. Built on every call rather than
+        cached, since containers are edited freely between requests
         @todo: determine how to handle pins, most likely include with the
         class responsible for creation
         """
-        temp_container = Container(
-            name=self.name,
-            label=self.label,
-            severity=self.severity,
-            sensitivity=self.sensitivity,
-            owner_name=self.owner_name,
-            owner_id=self.owner_id,
-            description=self.description,
-            kill_chain=self.kill_chain,
-            workflow_name=self.workflow_name,
-            custom_fields=self.custom_fields,
-            container_type=self.container_type,
-            status=self.status,
-            id=self.id,
+        temp_container = Container.from_dict(
+            {field: getattr(self, field) for field in self._CREATION_FIELDS}
         )
         if artifacts_included:
             temp_container.artifacts = self.artifacts
@@ -477,20 +855,30 @@ class Container(PhantomObject):
         If a name of a playbook is given, it will return the most recent instance of the playbook if there are
         multiple playbooks of the same name.
         """
-        for playbook in self.playbooks:
-            if name:
-                # Some API calls require including the repository in the playbook.name attribute.
-                # This simplifies finding them later on
-                if "/" in name:
-                    name = name.split("/")[-1]
+        # Some API calls require including the repository in the playbook.name attribute.
+        # This simplifies finding them later on
+        if name:
+            name = name.rsplit("/", 1)[-1]
+
+        if name and not playbook_run:
+            for playbook in self.playbooks:
                 if name in playbook.name:
                     return playbook
-            if playbook_run:
+            return None
+
+        if playbook_run and not name:
+            for playbook in self.playbooks:
                 if playbook.id == playbook_run:
                     return playbook
-            if playbook_id and playbook_run:
-                if playbook_id == playbook.playbook_id and playbook.id == playbook_run:
-                    return playbook
+            return None
+
+        # Given both, the first playbook matching either the name or the run is returned
+        for playbook in self.playbooks:
+            if name and name in playbook.name:
+                return playbook
+            if playbook_run and playbook.id == playbook_run:
+                return playbook
+        return None
 
     def get_artifact(self, name=None, label=None, id=None) -> Artifact:
         """Returns an artifact contained within the container"""
@@ -1,154 +1,96 @@
+import hashlib
+import io
 import tarfile
+import tempfile
 import unittest
 import json
 import pathlib
 import urllib3
-import random
-import requests
+from requests import HTTPError, Request, Response, Session
 import soarsdk
 from soarsdk.client import PhantomClient
-from soarsdk.objects import Artifact, Container, Playbook, Action, Pin, Asset, App
+from soarsdk.objects import Artifact, Container, Playbook, Action, Pin, Asset, App, Note
 from soarsdk.exceptions import *
 from soarsdk.objects import PhantomObject
+from contextlib import ExitStack
+from types import MappingProxyType
 from unittest.mock import Mock
 from unittest.mock import MagicMock
 from unittest.mock import patch
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
 
-class PhantomClientTests(unittest.TestCase):
-    @classmethod
-    def setUp(self) -> None:
-        self.container = Container(
-            name="soarsdk Test Container",
-            label="workbench",
-            artifacts=[Artifact(name="dummy", label="dummy")],
-        )
-        with patch("soarsdk.client.PhantomClient.test_authorization") as patched_auth:
-            self.phantom = PhantomClient(
-                url='https://example.test/', 
-                session=requests.session()
-            )
-            
-        self.mock_container = Container(name="test", label="foobar")
-        self.test_data = json.load(open("tests/sample_objects.json"))
-        self.test_artifacts = self.test_data["artifacts"]
-        self.test_containers = self.test_data["containers"]
 
-    @patch("requests.Session.post")
-    def test_create_container_throws_invalid_exception(self, mock_post):
-        mock_response = Mock()
-        mock_response.raise_for_status.side_effect = requests.HTTPError(
-            "Mocked HTTPError"
-        )
-        mock_post.return_value = mock_response
+# Attribute names of a Response, used as the spec for mocked responses so only real attributes can be set on them.
+# A list of names is used rather than the instance, which Mock would evaluate every property of
+_RESPONSE_SPEC: list[str] = dir(Response())
+# Attribute names of a Session, for the mocked session shared by the client tests
+_SESSION_SPEC: list[str] = dir(Session())
 
-        misconfigured_container: Container = Container(
-            name="bad container that should fail", label="NON_EXISTENT_LABEL"
-        )
-        with self.assertRaises(ServerException):
-            self.phantom.create_container(container=misconfigured_container)
 
-    @patch("requests.Session.post")
-    @patch("requests.Session.get")
-    def test_create_artifact(self, mock_post, mock_get):
-        mock_post_response = Mock()
-        mock_post_response.status_code = 200
-        mock_post_response.json.return_value = {"id": 1, "success": True}
-        mock_post.data = mock_post_response
-
-        mock_get_response = Mock()
-        mock_post_response.status_code = 200
-        mock_post_response.json.return_value = self.test_artifacts
-        mock_get.data = mock_get_response
-        test_artifact = Artifact(name="Test Artifact", label="Test Artifact")
-        mocked_container = Container(**self.test_containers[0])
-        self.phantom.create_artifacts(mocked_container, test_artifact)
-        self.assertEqual(test_artifact.container_id, mocked_container.id)
+def _mock_response(payload, status_code: int = 200, content: bytes = None) -> Mock:
+    """Builds a mocked response whose json() returns payload and whose content and raw stream hold its encoding"""
+    mock_response = Mock(spec_set=_RESPONSE_SPEC)
+    mock_response.status_code = status_code
+    mock_response.json.return_value = payload
+    mock_response.content = json.dumps(payload).encode() if content is None else content
+    mock_response.raw = io.BytesIO(mock_response.content)
+    return mock_response
 
-    def test_update_object(self):
-        object1: Artifact = Artifact(name="test", label="test", cef={})
-        object2: Artifact = Artifact(name="test", label="test", cef={"updated": True})
-        object1.update(object2)
-        assert object1.cef["updated"] == True
 
-    def test_run_playbooks_without_id(self):
-        uninitialized_container: Container = Container(name="test_container")
-        self.assertRaises(
-            soarsdk.exceptions.ContainerNotInitialized,
-            self.phantom.run_playbooks,
-            uninitialized_container,
-        )
+def _freeze(value):
+    """Returns a read-only copy of decoded JSON, with dicts as MappingProxyType and lists as tuples"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
 
-    def test_run_playbooks_no_args(self):
-        uninitialized_container: Container = Container(name="test_container", id=1)
-        self.assertRaises(
-            AttributeError,
-            self.phantom.run_playbooks,
-            uninitialized_container,
-        )
 
-    def test_playbook_exception_bool_property(self):
-        mocked_playbook: Playbook = Playbook(
-            name="playbook_exception_thrower",
-            logs=[
-                {
-                    "message": 'Unable to call the on_finish function for playbook \'test_throw_exception\'. Python Error: Traceback (most recent call last):\n  File "lib3/phantom/api/data_management/api_io_data.py/api_io_data.py", line 39, in save_playbook_output_data\n  File "/opt/phantom/usr/python39/lib/python3.9/site-packages/simplejson/__init__.py", line 395, in dumps\n    return _default_encoder.encode(obj)\n  File "/opt/phantom/usr/python39/lib/python3.9/site-packages/simplejson/encoder.py", line 296, in encode\n    chunks = self.iterencode(o, _one_shot=True)\n  File "/opt/phantom/usr/python39/lib/python3.9/site-packages/simplejson/encoder.py", line 378, in iterencode\n    return _iterencode(o, 0)\n  File "/opt/phantom/usr/python39/lib/python3.9/site-packages/simplejson/encoder.py", line 272, in default\n    raise TypeError(\'Object of type %s is not JSON serializable\' %\nTypeError: Object of type Test is not JSON serializable\n\nDuring handling of the above exception, another exception occurred:\n\nTraceback (most recent call last):\n  File "lib3/phantom/decided/playbook_resource_score.py/playbook_resource_score.py", line 126, in _wrapper\n  File "lib3/phantom/decided/playbook_resource_score.py/playbook_resource_score.py", line 123, in _wrapper\n  File "<test_throw_exception>", line 64, in on_finish\n  File "lib3/phantom/utils.py/utils.py", line 1152, in inner\n  File "lib3/phantom/api/data_management/api_io_data.py/api_io_data.py", line 41, in save_playbook_output_data\nTypeError: Error in save_playbook_output_data(): "output" must be a JSON-serializable object.\n',
-                    "time": "2023-05-20T01:08:40.681366Z",
-                    "message_type": 0,
-                },
-                {
-                    "message": "on_finish() called",
-                    "time": "2023-05-20T01:08:40.669705Z",
-                    "message_type": 1,
-                },
-            ],
-        )
-        self.assertTrue(mocked_playbook.exception_occurred)
-
-    def get_sample_artifact(self) -> Artifact:
-        """Grabs an artifact from the API to test methods"""
-        return self.test_artifacts[0]
-
-    def get_sample_container_with_playbook_run(self) -> Container:
-        sample_container_id: int = self.phantom.get_playbook_runs()[0].container
-        return Container(id=sample_container_id)
+def _thaw(value):
+    """Returns a mutable copy of a value frozen by _freeze(), shaped like freshly decoded JSON"""
+    if isinstance(value, MappingProxyType):
+        return {key: _thaw(item) for key, item in value.items()}
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
 
-    @patch("requests.Session.post")
-    def test_server_exception(self, mock_post):
-        """Tests that the ServerException is called when errors occur from the PhantomSide"""
-        mock_post_response = Mock()
-        mock_post_response.status_code = 400
-        mock_post_response.raise_for_status.side_effect = requests.HTTPError(
-            'Label "foobar" is not a known label.'
-        )
-        mock_post_response.json.return_value: dict = {
-            "failed": True,
-            "message": 'Label "foobar" is not a known label.',
-        }
 
-        mock_post.return_value = mock_post_response
+# Logs of a playbook run whose on_finish() raised, as returned by the playbook run log endpoint
+_PLAYBOOK_EXCEPTION_LOGS: tuple = (
+    {
+        "message": 'Unable to call the on_finish function for playbook \'test_throw_exception\'. Python Error: Traceback (most recent call last):\n  File "lib3/phantom/api/data_management/api_io_data.py/api_io_data.py", line 39, in save_playbook_output_data\n  File "/opt/phantom/usr/python39/lib/python3.9/site-packages/simplejson/__init__.py", line 395, in dumps\n    return _default_encoder.encode(obj)\n  File "/opt/phantom/usr/python39/lib/python3.9/site-packages/simplejson/encoder.py", line 296, in encode\n    chunks = self.iterencode(o, _one_shot=True)\n  File "/opt/phantom/usr/python39/lib/python3.9/site-packages/simplejson/encoder.py", line 378, in iterencode\n    return _iterencode(o, 0)\n  File "/opt/phantom/usr/python39/lib/python3.9/site-packages/simplejson/encoder.py", line 272, in default\n    raise TypeError(\'Object of type %s is not JSON serializable\' %\nTypeError: Object of type Test is not JSON serializable\n\nDuring handling of the above exception, another exception occurred:\n\nTraceback (most recent call last):\n  File "lib3/phantom/decided/playbook_resource_score.py/playbook_resource_score.py", line 126, in _wrapper\n  File "lib3/phantom/decided/playbook_resource_score.py/playbook_resource_score.py", line 123, in _wrapper\n  File "<test_throw_exception>", line 64, in on_finish\n  File "lib3/phantom/utils.py/utils.py", line 1152, in inner\n  File "lib3/phantom/api/data_management/api_io_data.py/api_io_data.py", line 41, in save_playbook_output_data\nTypeError: Error in save_playbook_output_data(): "output" must be a JSON-serializable object.\n',
+        "time": "2023-05-20T01:08:40.681366Z",
+        "message_type": 0,
+    },
+    {
+        "message": "on_finish() called",
+        "time": "2023-05-20T01:08:40.669705Z",
+        "message_type": 1,
+    },
+)
 
-        bad_container = Container(name="bad container that should fail", label="foobar")
-        self.assertRaises(ServerException, self.phantom.create_container, bad_container)
 
-    def test_bad_handle_request_method(self):
-        self.assertRaises(
-            AttributeError,
-            self.phantom._handle_request,
-            method="DESTROY",
-            url="container?",
+class PhantomClientTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls) -> None:
+        with open("tests/sample_objects.json", "rb") as sample_objects:
+            contents: bytes = sample_objects.read()
+        test_data: dict = (
+            orjson.loads(contents) if orjson is not None else json.loads(contents)
         )
 
-    def get_mock_artifacts_response(self) -> Mock:
-        mock_get_response = Mock()
-        mock_get_response.status_code = 200
-        mock_get_response.json.return_value: dict = self.test_artifacts
-        return mock_get_response
-
-    def get_mock_containers_response(self) -> Mock:
-        mock_get_response = Mock()
-        mock_get_response.status_code = 200
-        mock_get_response.json.return_value: dict = {
+        # Canned list responses, built once and shared by the get_mock_*_response() helpers
+        cls._mock_artifacts_json = {
+            "count": len(test_data["artifacts"]),
+            "num_pages": 1,
+            "data": test_data["artifacts"],
+        }
+        cls._mock_artifacts_content = json.dumps(cls._mock_artifacts_json).encode()
+        cls._mock_containers_json = {
             "count": 1,
             "num_pages": 1,
             "data": [
@@ -232,34 +174,490 @@ class PhantomClientTests(unittest.TestCase):
                 },
             ],
         }
-        return mock_get_response
+        cls._mock_containers_content = json.dumps(cls._mock_containers_json).encode()
 
-    @patch("soarsdk.client.PhantomClient.get_artifacts")
-    @patch("requests.Session.post")
-    @patch("requests.Session.get")
-    def test_create_artifact(self, mock_artifacts, mock_post, mock_get):
-        mock_response_post = Mock()
-        mock_response_post.status_code = 200
-        mock_response_post.json.return_value: dict = {"id": 1, "success": True}
-        mock_post.return_value = mock_response_post
-
-        # First Artifact intentionally has container field set to null
-        mocked_artifacts: list[dict] = [self.test_artifacts[0]]
-        mock_artifacts.return_value = mocked_artifacts
-        mock_get.return_value = self.get_mock_containers_response()
+        # Shared fixtures are frozen so a test cannot change them for the tests after it. Tests pass _thaw() copies
+        # to the SDK, which expects the mutable dicts and lists of decoded JSON
+        cls._test_data = _freeze(test_data)
+        cls._mock_artifacts_json = _freeze(cls._mock_artifacts_json)
+        cls._mock_containers_json = _freeze(cls._mock_containers_json)
+
+        # HTTP is mocked, so one client serves every test. tearDown() resets the state tests can leave behind
+        with patch("soarsdk.client.PhantomClient.test_authorization"):
+            cls._phantom = PhantomClient(
+                url="https://example.test/", session=MagicMock(spec_set=_SESSION_SPEC)
+            )
+
+        cls.addClassCleanup(cls._phantom.close)
+
+        # The session's verbs are reset before each test
+        cls.mock_get = cls._phantom.session.get
+        cls.mock_post = cls._phantom.session.post
+        cls.mock_delete = cls._phantom.session.delete
+
+    def setUp(self) -> None:
+        self.container = Container(
+            name="soarsdk Test Container",
+            label="workbench",
+            artifacts=[Artifact(name="dummy", label="dummy")],
+        )
+        self.phantom = self._phantom
+        for session_mock in (self.mock_get, self.mock_post, self.mock_delete):
+            session_mock.reset_mock(return_value=True, side_effect=True)
+        self.mock_container = Container(name="test", label="foobar")
+        self.test_data = self._test_data
+        self.test_artifacts = self.test_data["artifacts"]
+        self.test_containers = self.test_data["containers"]
+
+    def tearDown(self) -> None:
+        self.phantom.invalidate_catalog()
+        self.phantom._hash_cache.clear()
+        self.phantom.requests_log.clear()
+        self.phantom._debug_log = False
+
+    def test_create_container_throws_invalid_exception(self):
+        mock_response = _mock_response(
+            {"failed": True, "message": "Mocked HTTPError"}, 400
+        )
+        mock_response.raise_for_status.side_effect = HTTPError("Mocked HTTPError")
+        self.mock_post.return_value = mock_response
+
+        misconfigured_container: Container = Container(
+            name="bad container that should fail", label="NON_EXISTENT_LABEL"
+        )
+        with self.assertRaises(ServerException):
+            self.phantom.create_container(container=misconfigured_container)
+
+    def test_create_container_sends_json_body(self):
+        self.mock_post.return_value = _mock_response({"id": 1, "success": True})
+
+        with (
+            patch("soarsdk.client.PhantomClient.get_containers") as mock_containers,
+            patch("soarsdk.client.PhantomClient.update_artifacts"),
+        ):
+            mock_containers.return_value = [Container(**_thaw(self.test_containers[0]))]
+            self.phantom.create_container(
+                Container(name="json container", label="events")
+            )
+
+        request_kwargs: dict = self.mock_post.call_args.kwargs
+        sent_body = request_kwargs["json"] or json.loads(request_kwargs["data"])
+        self.assertEqual(sent_body["name"], "json container")
+
+    def test_update_object(self):
+        object1: Artifact = Artifact(name="test", label="test", cef={})
+        object2: Artifact = Artifact(name="test", label="test", cef={"updated": True})
+        object1.update(object2)
+        assert object1.cef["updated"] == True
+
+    def test_update_skips_undeclared_response_keys(self):
+        container: Container = Container()
+        container.update(name="x", _pretty_owner="a")
+        self.assertEqual(container.name, "x")
+
+    def test_update_keeps_falsy_values_but_not_empty_defaults(self):
+        container: Container = Container(
+            id=1, run_auto=True, artifacts=[Artifact(name="kept", label="events")]
+        )
+        container.update(Container(id=1, run_auto=False, severity_id=0))
+        self.assertFalse(container.run_auto)
+        self.assertEqual(container.severity_id, 0)
+        self.assertEqual(container.artifacts[0].name, "kept")
+
+    def test_object_json_serialization(self):
+        artifact: Artifact = Artifact(name="test", label="test", cef={"ip": "1.1.1.1"})
+        self.assertEqual(json.loads(str(artifact)), artifact.toDict())
+        self.assertEqual(json.loads(artifact.toBytes()), artifact.toDict())
+        self.assertEqual(json.loads(repr(artifact)), artifact.toDict())
+        # The text forms keep the standard library's layout, only the wire encoding is compact
+        self.assertEqual(str(artifact), json.dumps(artifact.toDict()))
+        self.assertEqual(repr(artifact), json.dumps(artifact.toDict(), indent=4))
+
+    def test_artifact_hash_matches_equality(self):
+        first: Artifact = Artifact(name="test", label="events", id=1)
+        duplicate: Artifact = Artifact(name="test", label="events", id=2)
+        self.assertEqual(first, duplicate)
+        self.assertEqual(len({first, duplicate}), 1)
+        self.assertNotEqual(first, Artifact(name="test", label="files"))
+
+    def test_creation_copies_only_creation_fields(self):
+        artifact: Artifact = Artifact(**_thaw(self.test_artifacts[0]))
+        creation_artifact: Artifact = artifact.get_creation_artifact()
+        self.assertEqual(creation_artifact.name, artifact.name)
+        self.assertIs(creation_artifact.cef, artifact.cef)
+        self.assertIsNone(creation_artifact.id)
+
+        container: Container = Container(**_thaw(self.test_containers[0]))
+        container.artifacts = [artifact]
+        creation_container: Container = container.get_creation_container(
+            artifacts_included=False
+        )
+        self.assertEqual(creation_container.id, container.id)
+        self.assertEqual(creation_container.artifacts, [])
+        self.assertIsNot(
+            creation_container.tags, container.get_creation_container().tags
+        )
+
+    def test_parent_playbook_properties(self):
+        child_playbook: Playbook = Playbook(
+            name="child",
+            misc={
+                "parent_playbook_run": {
+                    "parent_playbook_run_id": 4,
+                    "parent_playbook_name": "parent",
+                }
+            },
+        )
+        self.assertEqual(child_playbook.get_parent_playbook_id, 4)
+        self.assertEqual(child_playbook.get_parent_playbook_name, "parent")
+        self.assertEqual(child_playbook.get_parent_playbook("name"), "parent")
+        self.assertIsNone(Playbook(name="root").get_parent_playbook_id)
+
+    def test_run_playbooks_without_id(self):
+        uninitialized_container: Container = Container(name="test_container")
+        with self.assertRaises(soarsdk.exceptions.ContainerNotInitialized):
+            self.phantom.run_playbooks(uninitialized_container)
+
+    def test_run_playbooks_no_args(self):
+        uninitialized_container: Container = Container(name="test_container", id=1)
+        with self.assertRaises(AttributeError):
+            self.phantom.run_playbooks(uninitialized_container)
+
+    @patch("time.sleep")
+    @patch("soarsdk.client.PhantomClient.update_container_values")
+    @patch("soarsdk.client.PhantomClient._poll_playbook_state")
+    @patch("soarsdk.client.PhantomClient._handle_request")
+    def test_run_playbooks_backs_off_while_running(
+        self, mock_request, mock_poll, mock_update, mock_sleep
+    ):
+        mock_request.return_value = {"playbook_run_id": 1}
+        mock_poll.side_effect = [(True, []), (True, []), (False, [])]
+
+        running_container: Container = Container(name="test_container", id=1)
+        self.phantom.run_playbooks(running_container, Playbook(name="test_playbook"))
+
+        self.assertEqual(mock_sleep.call_count, 2)
+        first_delay, second_delay = [call.args[0] for call in mock_sleep.call_args_list]
+        self.assertLess(first_delay, second_delay)
+
+    @patch("soarsdk.client.PhantomClient.get_playbooks")
+    def test_get_playbook_id_from_name_is_cached(self, mock_playbooks):
+        mock_playbooks.return_value = [Playbook(name="test_playbook", id=7)]
+
+        self.assertEqual(self.phantom.get_playbook_id_from_name("test_playbook"), 7)
+        self.assertEqual(self.phantom.get_playbook_id_from_name("test_playbook"), 7)
+        mock_playbooks.assert_called_once()
+
+        self.phantom.invalidate_playbook_cache()
+        self.phantom.get_playbook_id_from_name("test_playbook")
+        self.assertEqual(mock_playbooks.call_count, 2)
+
+    @patch("soarsdk.client.PhantomClient.check_approvals")
+    @patch("soarsdk.client.PhantomClient._handle_request")
+    def test_poll_playbook_state(self, mock_request, mock_approvals):
+        polled_container: Container = Container(name="test_container", id=1)
+
+        mock_request.return_value = []
+        self.assertEqual(
+            self.phantom._poll_playbook_state(polled_container), (False, [])
+        )
+
+        mock_request.return_value = [
+            {
+                "id": 1,
+                "approvals": [
+                    {"id": 2, "status": "pending"},
+                    {"id": 3, "status": "approved"},
+                ],
+            }
+        ]
+        self.assertEqual(
+            self.phantom._poll_playbook_state(polled_container),
+            (True, [{"id": 2, "status": "pending"}]),
+        )
+        mock_approvals.assert_not_called()
+
+        mock_request.return_value = [{"id": 1}]
+        mock_approvals.return_value = [{"id": 4}]
+        self.assertEqual(
+            self.phantom._poll_playbook_state(polled_container), (True, [{"id": 4}])
+        )
+
+    @patch("soarsdk.client.PhantomClient._handle_request")
+    def test_action_builder_objects_are_cached(self, mock_request):
+        mock_request.return_value = {
+            "apps": [{"name": "MaxMind", "id": 1}],
+            "actions": [{"name": "geolocate ip", "id": 2}],
+            "assets": [{"name": "maxmind", "id": 3}],
+        }
+        apps: list[App] = self.phantom.get_apps()
+        self.assertIs(self.phantom.get_apps()[0], apps[0])
+        self.assertEqual(self.phantom.get_asset_ids(), [3])
+        self.phantom.get_actions()
+        mock_request.assert_called_once()
+
+        self.phantom.invalidate_catalog()
+        self.assertIsNot(self.phantom.get_apps()[0], apps[0])
+        self.assertEqual(mock_request.call_count, 2)
+
+    @patch("soarsdk.client.PhantomClient._handle_request")
+    def test_get_app_matches_lowercase_substring(self, mock_request):
+        mock_request.return_value = {
+            "apps": [{"name": "MaxMind", "id": 1}, {"name": "WHOIS RDAP", "id": 2}]
+        }
+        self.assertEqual(self.phantom.get_app("rdap").id, 2)
+        self.assertEqual(self.phantom.get_app("MAXMIND").id, 1)
+        self.assertIsNone(self.phantom.get_app("VirusTotal"))
+        mock_request.assert_called_once()
+
+    @patch("soarsdk.client.PhantomClient._handle_request")
+    def test_get_app_prefers_exact_match(self, mock_request):
+        mock_request.return_value = {
+            "apps": [{"name": "HTTP Utilities", "id": 1}, {"name": "HTTP", "id": 2}]
+        }
+        self.assertEqual(self.phantom.get_app("http").id, 2)
+        self.assertEqual(self.phantom.get_app("util").id, 1)
+
+    def test_playbook_exception_bool_property(self):
+        mocked_playbook: Playbook = Playbook(
+            name="playbook_exception_thrower",
+            logs=list(_PLAYBOOK_EXCEPTION_LOGS),
+        )
+        self.assertTrue(mocked_playbook.exception_occurred)
+
+    def test_playbook_exceptions_follow_replaced_logs(self):
+        playbook: Playbook = Playbook(name="test_playbook", logs=[{"message_type": 1}])
+        self.assertFalse(playbook.exception_occurred)
+        playbook.logs[0] = {"message_type": 0}
+        self.assertTrue(playbook.exception_occurred)
+        self.assertEqual(playbook.get_exceptions(), [{"message_type": 0}])
+
+    def test_playbook_exceptions_follow_new_logs(self):
+        playbook: Playbook = Playbook(
+            name="test_playbook", logs=[{"message": "started", "message_type": 1}]
+        )
+        self.assertFalse(playbook.exception_occurred)
+        self.assertEqual(playbook.get_exceptions(), [])
+        playbook.logs.append({"message": "failed", "message_type": 0})
+        self.assertTrue(playbook.exception_occurred)
+        self.assertEqual(len(playbook.get_exceptions()), 1)
+
+    def get_sample_artifact(self) -> Artifact:
+        """Grabs an artifact from the API to test methods"""
+        return _thaw(self.test_artifacts[0])
+
+    def get_sample_container_with_playbook_run(self) -> Container:
+        sample_container_id: int = self.phantom.get_playbook_runs()[0].container
+        return Container(id=sample_container_id)
+
+    def test_server_exception(self):
+        """Tests that the ServerException is called when errors occur from the PhantomSide"""
+        mock_post_response = _mock_response(
+            {"failed": True, "message": 'Label "foobar" is not a known label.'}, 400
+        )
+        mock_post_response.raise_for_status.side_effect = HTTPError(
+            'Label "foobar" is not a known label.'
+        )
+        self.mock_post.return_value = mock_post_response
+
+        bad_container = Container(name="bad container that should fail", label="foobar")
+        with self.assertRaises(ServerException) as raised:
+            self.phantom.create_container(bad_container)
+        self.assertIn('Label "foobar" is not a known label.', str(raised.exception))
+        self.assertLessEqual(mock_post_response.json.call_count, 1)
+
+    def test_handle_request_accepts_lowercase_method(self):
+        self.mock_get.return_value = _mock_response({"version": "6.0.0"})
+        self.assertEqual(
+            self.phantom._handle_request(method="get", url="version"),
+            {"version": "6.0.0"},
+        )
+
+    def test_bad_handle_request_method(self):
+        with self.assertRaises(AttributeError):
+            self.phantom._handle_request(method="DESTROY", url="container?")
+
+    def test_url_resolution(self):
+        self.assertEqual(
+            self.phantom._url("container?"), "https://example.test/rest/container?"
+        )
+        self.assertEqual(
+            self.phantom._url("https://example.test/upload_chunked"),
+            "https://example.test/upload_chunked",
+        )
+        self.assertEqual(
+            self.phantom._url("https://files.example.test/export"),
+            "https://files.example.test/export",
+        )
+
+    def test_string_params_are_json_encoded(self):
+        self.mock_get.return_value = self.get_mock_containers_response()
+        params: dict = {"_filter_name": "mock", "sort": "id"}
+        self.phantom.get_containers(params)
+        sent_params: dict = self.mock_get.call_args.kwargs["params"]
+        self.assertEqual(sent_params["_filter_name"], '"mock"')
+        self.assertEqual(sent_params["sort"], "id")
+        self.assertEqual(params["_filter_name"], "mock")
+
+    @patch("soarsdk.client.PhantomClient._handle_request")
+    def test_paginate_requests_every_page(self, mock_request):
+        mock_request.side_effect = [
+            {
+                "count": 3,
+                "num_pages": 2,
+                "data": [{"message": "first"}, {"message": "second"}],
+            },
+            {"count": 3, "num_pages": 2, "data": [{"message": "third"}]},
+        ]
+        logs: list[dict] = list(
+            self.phantom._paginate("playbook_run/1/log", {"sort": "time"}, page_size=2)
+        )
+
+        self.assertEqual([log["message"] for log in logs], ["first", "second", "third"])
+        requested_pages: list[int] = [
+            call.kwargs["params"]["page"] for call in mock_request.call_args_list
+        ]
+        self.assertEqual(requested_pages, [0, 1])
+
+    @patch("soarsdk.client.httpx.Client")
+    def test_http2_client_copies_cookies_once(self, mock_http2_client):
+        session: MagicMock = self.phantom.session
+        cookies, headers = session.cookies, session.headers
+        session.cookies, session.headers = {"csrftoken": "token"}, {}
+        try:
+            for _ in range(2):
+                self.phantom._send_http2(
+                    "GET", "https://example.test/rest/version", None, {}, {}, None, True
+                )
+        finally:
+            session.cookies, session.headers = cookies, headers
+            self.phantom._http2_client = None
+
+        mock_http2_client.assert_called_once()
+        self.assertEqual(
+            dict(mock_http2_client.call_args.kwargs["cookies"]), {"csrftoken": "token"}
+        )
+        self.assertEqual(mock_http2_client.return_value.request.call_count, 2)
 
+    def test_requests_log_is_opt_in(self):
+        logged_response = Response()
+        logged_response.status_code = 200
+        logged_response.reason = "OK"
+        logged_response.url = "https://example.test/rest/version"
+        logged_response._content = b'{"version": "6.0.0"}'
+        logged_response.request = Request(
+            "GET", "https://example.test/rest/version"
+        ).prepare()
+
+        self.phantom._generate_log(logged_response)
+        self.assertEqual(len(self.phantom.requests_log), 0)
+
+        self.phantom._debug_log = True
+        self.phantom._generate_log(logged_response)
+        self.assertIn('{"version": "6.0.0"}', self.phantom.format_requests_log())
+        self.assertNotIn(logged_response, self.phantom.requests_log[0])
+
+        logged_response._content = b"x" * 10000
+        self.phantom._generate_log(logged_response)
+        self.assertLess(len(self.phantom.requests_log[1][-1]), 10000)
+        self.assertTrue(self.phantom.requests_log[1][-1].endswith("... <truncated>"))
+
+    def get_mock_artifacts_response(self) -> Mock:
+        return _mock_response(
+            _thaw(self._mock_artifacts_json), content=self._mock_artifacts_content
+        )
+
+    def get_mock_containers_response(self) -> Mock:
+        return _mock_response(
+            _thaw(self._mock_containers_json), content=self._mock_containers_content
+        )
+
+    def test_create_artifact(self):
+        self.mock_post.return_value = _mock_response({"id": 1, "success": True})
+
+        for use_get_artifacts_patch in (False, True):
+            with (
+                self.subTest(use_get_artifacts_patch=use_get_artifacts_patch),
+                ExitStack() as stack,
+            ):
+                if use_get_artifacts_patch:
+                    # First Artifact intentionally has container field set to null
+                    mock_artifacts = stack.enter_context(
+                        patch("soarsdk.client.PhantomClient.get_artifacts")
+                    )
+                    mock_artifacts.return_value = [_thaw(self.test_artifacts[0])]
+                    self.mock_get.return_value = self.get_mock_containers_response()
+                    test_container: Container = Container(
+                        name="mock_container", label="mock_label", id=1
+                    )
+                else:
+                    self.mock_get.return_value = self.get_mock_artifacts_response()
+                    test_container = Container(**_thaw(self.test_containers[0]))
+                test_artifact: Artifact = Artifact(
+                    name="Test Artifact", label="Test Artifact"
+                )
+                self.phantom.create_artifacts(test_container, test_artifact)
+                self.assertEqual(test_artifact.container_id, test_container.id)
+
+    @patch("soarsdk.client.PhantomClient.update_artifacts")
+    @patch("soarsdk.client.PhantomClient._handle_request")
+    def test_create_artifacts_in_single_request(self, mock_request, mock_update):
+        mock_request.return_value = [
+            {"success": True, "id": 10},
+            {"success": True, "id": 11},
+        ]
         test_container: Container = Container(
             name="mock_container", label="mock_label", id=1
         )
+        test_container.add_artifact(
+            Artifact(name="Queued Artifact", label="Test Artifact")
+        )
         test_artifact: Artifact = Artifact(name="Test Artifact", label="Test Artifact")
+
         self.phantom.create_artifacts(test_container, test_artifact)
-        self.assertEqual(test_artifact.container_id, test_container.id)
-        
-    @patch("requests.Session.delete")
-    def test_delete_artifact(self, mock_delete):
-        mock_delete_response = Mock()
-        mock_delete_response.status_code == 200
-        mock_delete.return_value = mock_delete_response
+
+        mock_request.assert_called_once()
+        self.assertEqual(len(mock_request.call_args.kwargs["json"]), 2)
+        self.assertEqual(test_artifact.id, 10)
+        self.assertEqual(test_container.artifacts[0].id, 11)
+
+    @patch("soarsdk.client.PhantomClient.update_artifacts")
+    @patch("soarsdk.client.PhantomClient._handle_request")
+    def test_create_artifacts_reads_bulk_ids(self, mock_request, mock_update):
+        mock_request.return_value = {"ids": [20, 21], "success": True}
+        test_container: Container = Container(
+            name="mock_container", label="mock_label", id=1
+        )
+        first: Artifact = Artifact(name="First Artifact", label="Test Artifact")
+        second: Artifact = Artifact(name="Second Artifact", label="Test Artifact")
+
+        self.phantom.create_artifacts(test_container, first, second)
+
+        mock_request.assert_called_once()
+        self.assertEqual([first.id, second.id], [20, 21])
+
+    @patch("soarsdk.client.PhantomClient.update_artifacts")
+    @patch("soarsdk.client.PhantomClient._handle_request")
+    def test_create_artifacts_does_not_repost_after_server_error(
+        self, mock_request, mock_update
+    ):
+        server_error: ServerException = ServerException(
+            _mock_response({"failed": True, "message": "Internal error"}, 500),
+            body={"failed": True, "message": "Internal error"},
+        )
+        mock_request.side_effect = server_error
+        test_container: Container = Container(
+            name="mock_container", label="mock_label", id=1
+        )
+
+        with self.assertRaises(ServerException):
+            self.phantom.create_artifacts(
+                test_container, Artifact(name="Test Artifact")
+            )
+        mock_request.assert_called_once()
+
+    def test_delete_artifact(self):
+        self.mock_delete.return_value = _mock_response({"success": True})
 
         deletion_artifact: Artifact = Artifact(
             name="test-delete", label="test-delete", id=1337
@@ -268,112 +666,457 @@ class PhantomClientTests(unittest.TestCase):
         self.phantom.delete_artifact(deletion_artifact)
         self.assertIsNone(deletion_artifact.id)
 
-    @patch("requests.Session.delete")
-    def test_delete_artifact_by_int(self, mock_delete):
-        mock_delete_response = Mock()
-        mock_delete_response.status_code == 200
-        mock_delete.return_value = mock_delete_response
+    def test_delete_artifact_by_int(self):
+        self.mock_delete.return_value = _mock_response({"success": True})
         self.phantom.delete_artifact(1)
 
+    @patch("soarsdk.client.PhantomClient._handle_request")
+    def test_delete_container_batches_unique_ids(self, mock_request):
+        containers: list[Container] = [Container(id=i) for i in range(1, 251)]
+        containers.append(Container(id=1))
+        self.phantom.delete_container(*containers)
+
+        deleted_batches: list[list[int]] = [
+            call.kwargs["params"]["ids"] for call in mock_request.call_args_list
+        ]
+        self.assertEqual([len(batch) for batch in deleted_batches], [200, 50])
+        self.assertEqual(sum(deleted_batches, []), list(range(1, 251)))
+        self.assertTrue(all(container.id is None for container in containers))
+
+    @patch("soarsdk.client.PhantomClient._handle_request")
+    def test_find_by_hash_is_cached(self, mock_request):
+        mock_request.return_value = [{"id": 42}]
+        self.assertEqual(self.phantom.find_by_hash("mock_hash", "artifact"), 42)
+        self.assertEqual(self.phantom.find_by_hash("mock_hash", "artifact"), 42)
+        mock_request.assert_called_once()
+
+        self.phantom.find_by_hash("mock_hash", "container")
+        self.assertEqual(mock_request.call_count, 2)
+
     def test_delete_artifact_no_id(self):
         deletion_artifact: Artifact = Artifact(
             name="Nonexistent artifact", label="None"
         )
-        self.assertRaises(
-            ArtifactNotInitialized, self.phantom.delete_artifact, deletion_artifact
-        )
+        with self.assertRaises(ArtifactNotInitialized):
+            self.phantom.delete_artifact(deletion_artifact)
 
     def test_upload_file_to_container_wrong_file(self):
         test_upload_file: pathlib.Path = pathlib.Path("./tests/ImaginaryFile.json")
-        self.assertRaises(
-            FileNotFoundError,
-            self.phantom.upload_file,
-            container=self.container,
-            file_path=test_upload_file,
+        with self.assertRaises(FileNotFoundError):
+            self.phantom.upload_file(
+                container=self.container, file_path=test_upload_file
+            )
+
+    @patch("soarsdk.client.PhantomClient._handle_request")
+    def test_upload_file_hashes_uploaded_contents(self, mock_request):
+        uploaded_bodies: list[bytes] = []
+
+        def send_upload(**kwargs) -> dict:
+            if not isinstance(kwargs["data"], dict):
+                # Reading the streamed body like requests does is what hashes it
+                uploaded_bodies.append(b"".join(kwargs["data"]))
+                self.assertEqual(len(uploaded_bodies[0]), len(kwargs["data"]))
+            return {"upload_id": 1}
+
+        mock_request.side_effect = send_upload
+        with tempfile.NamedTemporaryFile(suffix=".json") as upload_file:
+            upload_file.write(b'{"mock": "upload"}')
+            upload_file.flush()
+            self.phantom.upload_file(
+                container=Container(id=1), file_path=upload_file.name
+            )
+
+        self.assertNotIn("files", mock_request.call_args_list[0].kwargs)
+        self.assertIn(b'{"mock": "upload"}', uploaded_bodies[0])
+        final_upload_data: dict = mock_request.call_args.kwargs["data"]
+        self.assertEqual(
+            final_upload_data["sha256"],
+            hashlib.sha256(b'{"mock": "upload"}').hexdigest(),
         )
 
-    @patch("requests.Session.get")
-    def test_get_container_attachment_ids_no_files(self, mock_get):
-        mock_get_response = Mock()
-        mock_get_response.status_code = 200
-        mock_get_response.json.return_value = {"count": 0, "num_pages": 0, "data": []}
-        mock_get.return_value = mock_get_response
+    def test_get_container_attachment_ids_no_files(self):
+        self.mock_get.return_value = _mock_response(
+            {"count": 0, "num_pages": 0, "data": []}
+        )
 
         attachment_ids: list[int] = self.phantom.get_container_attachments_ids(
             self.mock_container
         )
         self.assertEqual(attachment_ids, [])
 
-    def test_export_container_as_tar(self):
-        ...
+    @patch("soarsdk.client.PhantomClient._handle_request")
+    def test_get_container_attachment_ids_tolerates_missing_id(self, mock_request):
+        mock_request.return_value = [{"id": 7}, {"name": "no_id.txt"}]
 
-    def test_export_container_as_tar_bad_params(self):
-        self.assertRaises(
-            ContainerNotInitialized,
-            self.phantom.export_container_as_tar,
-            self.mock_container,
+        attachment_ids: list[int] = self.phantom.get_container_attachments_ids(
+            self.mock_container
         )
+        self.assertEqual(attachment_ids, [7, None])
+
+    @patch("soarsdk.client.PhantomClient._handle_request")
+    def test_get_comments_tolerates_missing_comment_key(self, mock_request):
+        mock_request.return_value = [{"comment": "first"}, {"id": 2}]
+
+        container: Container = Container(id=1)
+        self.phantom.get_comments(container)
+        self.assertEqual(container.comments, ["first", None])
 
-    @patch("requests.Session.get")
-    def test_get_containers(self, mock_get):
+    @patch("soarsdk.client.PhantomClient._handle_request")
+    @patch("soarsdk.client.PhantomClient.get_container_attachments_ids")
+    @patch("soarsdk.client.PhantomClient.update_container_values")
+    def test_export_container_as_tar(self, mock_update, mock_attachments, mock_request):
+        mock_attachments.return_value = []
+        mock_export_response = MagicMock()
+        mock_export_response.iter_content.return_value = [
+            b"first-chunk",
+            b"second-chunk",
+        ]
+        mock_request.return_value = mock_export_response
+
+        with tempfile.TemporaryDirectory() as download_path:
+            export_path: pathlib.Path = self.phantom.export_container_as_tar(
+                Container(id=1), download_path=download_path
+            )
+            self.assertEqual(export_path.read_bytes(), b"first-chunksecond-chunk")
+        self.assertTrue(mock_request.call_args.kwargs["stream"])
+
+    def test_export_container_as_tar_bad_params(self):
+        with self.assertRaises(ContainerNotInitialized):
+            self.phantom.export_container_as_tar(self.mock_container)
+
+    def test_get_containers(self):
         params: dict = {"page_size": 1}
-        mock_get.return_value = self.get_mock_containers_response()
+        self.mock_get.return_value = self.get_mock_containers_response()
         containers: list[Container] = self.phantom.get_containers(params)
         for container in containers:
             self.assertIsInstance(container, Container)
 
-    @patch("requests.Session.get")
-    def test_get_artifacts(self, mock_get):
+    @patch("soarsdk.client.PhantomClient.update_container_values")
+    def test_get_enriched_containers(self, mock_update):
+        self.mock_get.return_value = self.get_mock_containers_response()
+        containers: list[Container] = self.phantom.get_enriched_containers({})
+        self.assertEqual([container.id for container in containers], [1, 2])
+        self.assertEqual(mock_update.call_count, 2)
+
+    def test_get_artifacts(self):
         params: dict = {}
+        self.mock_get.return_value = self.get_mock_artifacts_response()
         artifacts: list[Artifact] = self.phantom.get_artifacts(params)
-        mock_get.return_value = self.get_mock_artifacts_response()
         for artifact in artifacts:
             self.assertIsInstance(artifact, Artifact)
 
+    def test_from_dict_matches_constructor(self):
+        artifact_data: dict = {
+            "id": 7,
+            "name": "test",
+            "label": "events",
+            "cef": {"ip": "1.1.1.1"},
+        }
+        artifact: Artifact = Artifact.from_dict(artifact_data)
+        self.assertEqual(artifact.toDict(), Artifact(**artifact_data).toDict())
+
+        first: Container = Container.from_dict({"id": 1})
+        second: Container = Container.from_dict({"id": 2})
+        first.artifacts.append(artifact)
+        self.assertEqual(second.artifacts, [])
+
+    def test_objects_only_accept_declared_fields(self):
+        artifact: Artifact = Artifact(name="test", label="events")
+        self.assertFalse(hasattr(artifact, "__dict__"))
+        with self.assertRaises(AttributeError):
+            artifact.nmae = "typo"
+
+    def test_container_lookups_follow_changes(self):
+        container: Container = Container(
+            id=1, artifacts=[Artifact(name="first", label="events")]
+        )
+        self.assertEqual(container.get_artifact(name="first").label, "events")
+        self.assertIsNone(container.get_artifact(id=5))
+        container.artifacts[0].id = 5
+        self.assertEqual(container.get_artifact(id=5).name, "first")
+        container.add_artifact(Artifact(name="second", label="files"))
+        self.assertEqual(container.get_artifact(label="files").name, "second")
+
+        playbook: Playbook = Playbook(
+            name="enrich_indicators", id=10, actions=[Action(name="geolocate ip")]
+        )
+        container.add_playbooks(playbook)
+        self.assertIs(container.get_playbook(name="local/enrich_indicators"), playbook)
+        self.assertIs(container.get_playbook(name="enrich"), playbook)
+        self.assertIs(container.get_playbook(playbook_run=10), playbook)
+        self.assertEqual(len(container.get_action("geolocate ip")), 1)
+        playbook.append(Action(name="geolocate ip"))
+        self.assertEqual(len(container.get_action("geolocate ip")), 2)
+        self.assertIs(playbook.get_action("geolocate ip"), playbook.actions[0])
+
+    def test_low_cardinality_fields_are_interned(self):
+        label: str = "".join(["eve", "nts"])
+        first: Container = Container.from_dict({"label": label})
+        second: Container = Container(label="".join(["eve", "nts"]))
+        self.assertIs(first.label, second.label)
+
+    def test_generated_to_dict_matches_generic(self):
+        container: Container = Container(
+            id=4,
+            label="events",
+            artifacts=[Artifact(name="test", cef={"ip": "1.1.1.1"})],
+        )
+        self.assertEqual(container.toDict(), PhantomObject.toDict(container))
+        self.assertEqual(
+            container.toDict()["artifacts"],
+            [{"name": "test", "cef": {"ip": "1.1.1.1"}, "severity_id": "low"}],
+        )
+
+        del container.label
+        self.assertEqual(container.toDict(), PhantomObject.toDict(container))
+
+    def test_to_dict_includes_subclass_attributes(self):
+        class TaggedArtifact(Artifact):
+            pass
+
+        artifact: TaggedArtifact = TaggedArtifact(name="tagged")
+        artifact.extra = "kept"
+
+        self.assertEqual(artifact.toDict()["extra"], "kept")
+        self.assertEqual(artifact.toDict(), PhantomObject.toDict(artifact))
+
+    def test_generated_to_dict_raises_nested_errors_once(self):
+        container: Container = Container(id=4, artifacts=[Artifact(name="broken")])
+
+        with patch.object(
+            Artifact, "toDict", side_effect=AttributeError("nested")
+        ) as mock_to_dict:
+            with self.assertRaises(AttributeError):
+                container.toDict()
+        mock_to_dict.assert_called_once()
+
+    def test_add_artifact_rejects_mixed_arguments(self):
+        container: Container = Container(id=3)
+        with self.assertRaises(PhantomObjectRequired):
+            container.add_artifact(Artifact(name="valid"), "not an artifact")
+        self.assertEqual(container.artifacts, [])
+
+        container.add_artifact(Artifact(name="first"), Artifact(name="second"))
+        self.assertEqual(
+            [artifact.container_id for artifact in container.artifacts], [3, 3]
+        )
+
     def test_update_container_values_none_id(self):
         bad_container: Container = Container(name="test", label="foobar")
-        self.assertRaises(
-            ContainerNotInitialized, self.phantom.update_container_values, bad_container
+        with self.assertRaises(ContainerNotInitialized):
+            self.phantom.update_container_values(bad_container)
+
+    @patch("soarsdk.client.PhantomClient.get_notes")
+    @patch("soarsdk.client.PhantomClient.get_comments")
+    @patch("soarsdk.client.PhantomClient.get_pins")
+    @patch("soarsdk.client.PhantomClient.get_playbook_runs")
+    @patch("soarsdk.client.PhantomClient.get_artifacts")
+    @patch("soarsdk.client.PhantomClient._get_container_bundle")
+    def test_update_container_values_uses_inline_artifacts(
+        self,
+        mock_bundle,
+        mock_artifacts,
+        mock_playbook_runs,
+        mock_pins,
+        mock_comments,
+        mock_notes,
+    ):
+        container_data: dict = _thaw(self.test_containers[0])
+        container_data["artifacts"] = [_thaw(self.test_artifacts[0])]
+        mock_bundle.return_value = container_data
+        mock_playbook_runs.return_value = []
+
+        container: Container = Container(id=1)
+        self.phantom.update_container_values(container)
+
+        mock_artifacts.assert_not_called()
+        mock_pins.assert_called_once()
+        self.assertEqual(container.name, self.test_containers[0]["name"])
+        self.assertIsInstance(container.artifacts[0], Artifact)
+
+    @patch("soarsdk.client.PhantomClient.get_notes")
+    @patch("soarsdk.client.PhantomClient.get_comments")
+    @patch("soarsdk.client.PhantomClient.get_pins")
+    @patch("soarsdk.client.PhantomClient.get_artifacts")
+    @patch("soarsdk.client.PhantomClient.get_playbook_runs")
+    @patch("soarsdk.client.PhantomClient._get_container_bundle")
+    def test_update_container_values_uses_inline_annotations(
+        self,
+        mock_bundle,
+        mock_playbook_runs,
+        mock_artifacts,
+        mock_pins,
+        mock_comments,
+        mock_notes,
+    ):
+        container_data: dict = _thaw(self.test_containers[0])
+        container_data["pins"] = [{"message": "inline pin", "pin_style": "red"}]
+        container_data["comments"] = [{"comment": "inline comment"}, {"id": 9}]
+        container_data["notes"] = [{"id": 4, "content": "inline note"}]
+        mock_bundle.return_value = container_data
+        mock_playbook_runs.return_value = []
+
+        container: Container = Container(id=1)
+        container.pins.append(Pin(message="existing pin"))
+        container.comments = ["stale comment"]
+        container.notes = [Note(id=1)]
+        self.phantom.update_container_values(container)
+
+        # Inline pins extend the container like get_pins(), comments and notes replace it like their getters
+        mock_pins.assert_not_called()
+        mock_comments.assert_not_called()
+        mock_notes.assert_not_called()
+        self.assertEqual(
+            [pin.message for pin in container.pins], ["existing pin", "inline pin"]
         )
+        self.assertEqual(container.pins[1].style, "red")
+        self.assertEqual(container.comments, ["inline comment", None])
+        self.assertEqual([note.content for note in container.notes], ["inline note"])
 
-    def test_update_Container_values_bad_param(self):
-        self.assertRaises(
-            ContainerNotInitialized,
-            self.phantom.modify_container_values,
-            Container(name="test", label="foobar"),
+    @patch("soarsdk.client.PhantomClient.get_notes")
+    @patch("soarsdk.client.PhantomClient.get_comments")
+    @patch("soarsdk.client.PhantomClient.get_pins")
+    @patch("soarsdk.client.PhantomClient.get_artifacts")
+    @patch("soarsdk.client.PhantomClient.get_playbook_runs")
+    @patch("soarsdk.client.PhantomClient._get_container_bundle")
+    def test_update_container_values_merges_declared_playbooks(
+        self, mock_bundle, mock_playbook_runs, *mock_fetches
+    ):
+        mock_bundle.return_value = _thaw(self.test_containers[0])
+        mock_playbook_runs.return_value = [
+            Playbook(name="test_playbook", id=3),
+            Playbook(name="other_playbook", id=4),
+        ]
+
+        container: Container = Container(id=1)
+        container.add_playbooks(Playbook(name="local/test_playbook"))
+        self.phantom.update_container_values(container)
+
+        self.assertEqual(len(container.playbooks), 2)
+        self.assertEqual(container.playbooks[0].id, 3)
+
+    @patch("soarsdk.client.PhantomClient.get_notes")
+    @patch("soarsdk.client.PhantomClient.get_comments")
+    @patch("soarsdk.client.PhantomClient.get_pins")
+    @patch("soarsdk.client.PhantomClient.get_artifacts")
+    @patch("soarsdk.client.PhantomClient.get_playbook_runs")
+    @patch("soarsdk.client.PhantomClient._get_container_bundle")
+    def test_update_container_values_merges_runs_by_substring(
+        self, mock_bundle, mock_playbook_runs, *mock_fetches
+    ):
+        mock_bundle.return_value = _thaw(self.test_containers[0])
+        mock_playbook_runs.return_value = [Playbook(name="enrich", id=5)]
+
+        container: Container = Container(id=1)
+        container.add_playbooks(Playbook(name="local/enrich_indicators"))
+        self.phantom.update_container_values(container)
+
+        self.assertEqual(len(container.playbooks), 1)
+        self.assertEqual(container.playbooks[0].id, 5)
+
+    @patch("soarsdk.client.PhantomClient.get_playbook_logs")
+    @patch("soarsdk.client.PhantomClient.get_playbook_name_from_id")
+    @patch("soarsdk.client.PhantomClient.get_action_runs")
+    @patch("soarsdk.client.PhantomClient._handle_request")
+    def test_get_playbook_runs_enriches_each_run(
+        self, mock_request, mock_action_runs, mock_playbook_name, mock_logs
+    ):
+        mock_request.return_value = [
+            {"id": run_id, "playbook": run_id + 100} for run_id in range(1, 6)
+        ]
+        mock_action_runs.return_value = []
+        mock_playbook_name.side_effect = lambda playbook_id: f"playbook_{playbook_id}"
+        mock_logs.return_value = []
+
+        playbooks: list[Playbook] = self.phantom.get_playbook_runs(params={})
+
+        self.assertEqual([playbook.id for playbook in playbooks], [1, 2, 3, 4, 5])
+        self.assertEqual(playbooks[0].name, "playbook_101")
+        self.assertEqual(mock_action_runs.call_count, 5)
+
+    @patch("soarsdk.client.PhantomClient.get_app_runs")
+    @patch("soarsdk.client.PhantomClient._handle_request")
+    def test_get_action_runs_batches_app_runs(self, mock_request, mock_app_runs):
+        mock_request.return_value = [
+            {"id": 1, "name": "geolocate"},
+            {"id": 2, "name": "whois"},
+        ]
+        mock_app_runs.return_value = [
+            {"id": 10, "action_run": 2, "app_name": "WHOIS"},
+            {"id": 11, "action_run": 1, "app_name": "MaxMind"},
+        ]
+
+        actions: list[Action] = self.phantom.get_action_runs(
+            {"_filter_playbook_run": 1}
         )
 
-    def test_update_object(self):
-        object1: Artifact = Artifact(name="test", label="test", cef={})
-        object2: Artifact = Artifact(name="test", label="test", cef={"updated": True})
-        object1.update(object2)
-        assert object1.cef.get("updated")
+        mock_app_runs.assert_called_once()
+        self.assertEqual(
+            mock_app_runs.call_args.kwargs["params"]["_filter_action_run__in"], "[1, 2]"
+        )
+        self.assertEqual([action.app_run for action in actions], [11, 10])
+        self.assertEqual(actions[1].app_name, "WHOIS")
 
+    def test_update_Container_values_bad_param(self):
+        with self.assertRaises(ContainerNotInitialized):
+            self.phantom.modify_container_values(Container(name="test", label="foobar"))
 
-class PhantomClientAuthenticationTest(unittest.TestCase):
-    @classmethod
-    def setUp(self) -> None:
-        pass
 
+class PhantomClientAuthenticationTest(unittest.TestCase):
     def test_invalid_kwargs_raises_exception(self):
-        self.assertRaises(ConnectionError, PhantomClient, "www.example.com")
+        with self.assertRaises(ConnectionError):
+            PhantomClient("www.example.com")
+
+    @patch("soarsdk.client.httpx", None)
+    def test_http2_without_httpx_raises_exception(self):
+        with self.assertRaises(ImportError):
+            PhantomClient("www.example.com", session=Session(), http2=True)
+
+    @patch("soarsdk.client.PhantomClient.test_authorization")
+    def test_close_shuts_down_workers_and_session(self, mock_auth):
+        session: MagicMock = MagicMock(spec_set=_SESSION_SPEC)
+        with PhantomClient("https://example.test/", session=session) as phantom:
+            phantom._executor.submit(int).result()
+        session.close.assert_called_once()
+        with self.assertRaises(RuntimeError):
+            phantom._executor.submit(int)
+
+    @patch("soarsdk.client.PhantomClient.test_authorization")
+    def test_provided_session_is_not_reconfigured(self, mock_auth):
+        session: Session = Session()
+        session.verify = True
+        session.headers["Accept-Encoding"] = "identity"
+        PhantomClient("https://example.test/", session=session)
+        self.assertTrue(session.verify)
+        self.assertEqual(session.headers["Accept-Encoding"], "identity")
+
+    @patch("soarsdk.client.PhantomClient.connect")
+    def test_client_session_carries_tls_verification(self, mock_connect):
+        with PhantomClient(
+            "https://example.test/", splunkToken="token", verify=True
+        ) as phantom:
+            self.assertTrue(phantom.session.verify)
+            with patch.object(
+                phantom.session, "request", return_value=_mock_response({})
+            ) as mock_request:
+                phantom.test_authorization()
+            # None defers to the session's own setting
+            self.assertIsNone(mock_request.call_args.kwargs["verify"])
+
+    def test_provided_session_gets_tls_verification_per_request(self):
+        session: MagicMock = MagicMock(spec_set=_SESSION_SPEC)
+        session.get.return_value = _mock_response({"version": "6.0.0"})
+        with PhantomClient("https://example.test/", session=session):
+            pass
+        self.assertFalse(session.get.call_args.kwargs["verify"])
 
     def test_username_password_missing_exception(self):
-        self.assertRaises(
-            AuthenticationError,
-            PhantomClient,
-            "www.example.com",
-            username="test_username",
-        )
-        self.assertRaises(
-            AuthenticationError,
-            PhantomClient,
-            "www.example.com",
-            password="test_password",
-        )
+        with self.assertRaises(AuthenticationError):
+            PhantomClient("www.example.com", username="test_username")
+        with self.assertRaises(AuthenticationError):
+            PhantomClient("www.example.com", password="test_password")
 
 
 if __name__ == "__main__":
-    unittest.main(warnings="ignore", failfast=True)
     urllib3.disable_warnings()
-    unittest.main()
+    unittest.main(warnings="ignore", failfast=True)